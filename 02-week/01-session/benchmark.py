@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Benchmark del extractor ETL Weatherstack contra un servidor local simulado
+
+Levanta un servidor HTTP que imita /current de Weatherstack (latencia,
+tasa de error y tamaño de payload configurables) y ejecuta el pipeline
+completo de WeatherstackExtractor (extraer → procesar → validar → guardar
+CSV/JSON) en distintos modos. No necesita API_KEY ni acceso a internet.
+
+Cada escenario corre en un proceso aparte para que el pico de memoria
+(RSS) sea el del escenario y no el de los anteriores.
+
+Uso:
+    python benchmark.py
+    python benchmark.py --ciudades 500 --latencia 0.08 --workers 16
+    python benchmark.py --modos secuencial concurrente async --error 0.05
+    python benchmark.py --salida data/bench_v2.json --comparar data/bench_v1.json
+    python benchmark.py --arranque --max-arranque 0.5
+
+Métricas por modo:
+    - registros/s de la corrida completa (extracción + guardado)
+    - latencia por llamada HTTP p50/p95/p99 (medida en el cliente)
+    - pico de RSS del proceso
+
+Con --arranque mide en cambio el tiempo de `import extractor` en procesos
+nuevos y falla si carga módulos pesados (pandas, numpy, matplotlib), si
+crea archivos al importarse o si supera --max-arranque segundos.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import tempfile
+import threading
+import multiprocessing
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from typing import Any, Dict, List, Optional
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+MODOS = ('secuencial', 'concurrente', 'lote', 'async')
+
+
+class _ServidorHTTP(ThreadingHTTPServer):
+    # La cola de listen por defecto (5) descarta conexiones simultáneas y el
+    # cliente las reintenta tras ~1s de SYN, lo que falsea p99
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+# ============================================================================
+# SERVIDOR WEATHERSTACK SIMULADO
+# ============================================================================
+
+class ServidorWeatherstackFalso:
+    """
+    Servidor HTTP local que responde como el endpoint /current de Weatherstack
+
+    Acepta consultas individuales y bulk ('ciudad1;ciudad2'). Corre en un
+    hilo en segundo plano; se puede usar como context manager.
+
+    Attributes:
+        latencia (float): Segundos de espera antes de cada respuesta
+        jitter (float): Variación aleatoria (±) sobre la latencia
+        tasa_error (float): Fracción de solicitudes que responden HTTP 500
+        tamano_payload (int): Bytes de relleno agregados a cada respuesta
+        url (str): URL base para WEATHERSTACK_BASE_URL
+    """
+
+    def __init__(self, latencia: float = 0.05, jitter: float = 0.0,
+                 tasa_error: float = 0.0, tamano_payload: int = 0,
+                 host: str = '127.0.0.1', puerto: int = 0):
+        self.latencia = latencia
+        self.jitter = jitter
+        self.tasa_error = tasa_error
+        self.tamano_payload = tamano_payload
+        self.solicitudes = 0
+        self._lock = threading.Lock()
+        self._servidor = _ServidorHTTP((host, puerto), self._crear_handler())
+        self._hilo: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, puerto = self._servidor.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+    def _respuesta(self, ciudad: str) -> Dict[str, Any]:
+        """Genera una respuesta plausible para una ciudad"""
+        ahora = time.time()
+        respuesta = {
+            'request': {'type': 'City', 'query': ciudad, 'language': 'en', 'unit': 'm'},
+            'location': {
+                'name': ciudad, 'country': 'Colombia', 'region': 'Benchmark',
+                'lat': f"{random.uniform(-4, 12):.3f}", 'lon': f"{random.uniform(-79, -67):.3f}",
+                'timezone_id': 'America/Bogota',
+                'localtime': datetime.fromtimestamp(ahora).strftime('%Y-%m-%d %H:%M'),
+                'localtime_epoch': int(ahora), 'utc_offset': '-5.0',
+            },
+            'current': {
+                'observation_time': datetime.fromtimestamp(ahora, timezone.utc).strftime('%I:%M %p'),
+                'temperature': random.randint(5, 35), 'feelslike': random.randint(5, 35),
+                'humidity': random.randint(30, 100), 'wind_speed': random.randint(0, 40),
+                'pressure': random.randint(1000, 1030), 'weather_code': 113,
+                'weather_descriptions': ['Sunny'],
+            },
+        }
+        if self.tamano_payload:
+            respuesta['relleno'] = 'x' * self.tamano_payload
+        return respuesta
+
+    def _crear_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'   # keep-alive, como la API real
+            disable_nagle_algorithm = True  # evita la espera de Nagle + ACK retardado
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with servidor._lock:
+                    servidor.solicitudes += 1
+                espera = servidor.latencia + random.uniform(-servidor.jitter, servidor.jitter)
+                if espera > 0:
+                    time.sleep(espera)
+
+                if random.random() < servidor.tasa_error:
+                    self._enviar(500, {'success': False, 'error': {'code': 500, 'info': 'simulado'}})
+                    return
+
+                ciudades = parse_qs(urlparse(self.path).query).get('query', [''])[0].split(';')
+                if len(ciudades) == 1:
+                    self._enviar(200, servidor._respuesta(ciudades[0]))
+                else:
+                    self._enviar(200, [servidor._respuesta(c) for c in ciudades])
+
+            def _enviar(self, estado: int, cuerpo: Any):
+                datos = json.dumps(cuerpo).encode('utf-8')
+                self.send_response(estado)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(datos)))
+                self.end_headers()
+                self.wfile.write(datos)
+
+        return Handler
+
+    def iniciar(self) -> 'ServidorWeatherstackFalso':
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def __enter__(self) -> 'ServidorWeatherstackFalso':
+        return self.iniciar()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.detener()
+
+
+# ============================================================================
+# ESCENARIO (SE EJECUTA EN UN PROCESO HIJO)
+# ============================================================================
+
+def percentil(valores: List[float], p: float) -> Optional[float]:
+    """Percentil por interpolación lineal (None si no hay valores)"""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posicion = (len(ordenados) - 1) * p / 100
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
+
+
+def _medir_sesion_requests(extractor, latencias: List[float]):
+    """Envuelve session.get del extractor para medir cada llamada HTTP"""
+    get_original = extractor.session.get
+    lock = threading.Lock()
+
+    def get_medido(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return get_original(*args, **kwargs)
+        finally:
+            with lock:
+                latencias.append(time.perf_counter() - inicio)
+
+    extractor.session.get = get_medido
+
+
+def _sesion_aiohttp_medida(concurrencia: int, latencias: List[float]):
+    """Crea una aiohttp.ClientSession que mide cada solicitud con TraceConfig"""
+    import aiohttp
+
+    async def al_iniciar(session, contexto, params):
+        contexto.inicio = time.perf_counter()
+
+    async def al_terminar(session, contexto, params):
+        latencias.append(time.perf_counter() - contexto.inicio)
+
+    traza = aiohttp.TraceConfig()
+    traza.on_request_start.append(al_iniciar)
+    traza.on_request_end.append(al_terminar)
+    traza.on_request_exception.append(al_terminar)
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrencia),
+                                 trace_configs=[traza])
+
+
+def ejecutar_escenario(modo: str, url: str, ciudades: int, workers: int,
+                       tamano_lote: int, con_logs: bool) -> Dict[str, Any]:
+    """
+    Corre el pipeline completo en un modo y devuelve sus métricas
+
+    Pensada para correr en un proceso hijo recién creado ('spawn'): trabaja
+    en un directorio temporal, que se elimina al terminar, y configura el
+    extractor por variables de entorno antes de importarlo.
+    """
+    anterior = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench_etl_') as trabajo:
+        os.chdir(trabajo)
+        try:
+            return _correr_escenario(trabajo, modo, url, ciudades, workers, tamano_lote, con_logs)
+        finally:
+            # Salir del directorio antes de eliminarlo
+            os.chdir(anterior)
+
+
+def _correr_escenario(trabajo: str, modo: str, url: str, ciudades: int, workers: int,
+                      tamano_lote: int, con_logs: bool) -> Dict[str, Any]:
+    """Cuerpo de ejecutar_escenario dentro del directorio temporal `trabajo`"""
+    import asyncio
+
+    os.environ.update({
+        'API_KEY': 'benchmark',
+        'WEATHERSTACK_BASE_URL': url,
+        'CIUDADES': ','.join(f"Ciudad{i:05d}" for i in range(ciudades)),
+        'CACHE_BACKEND': 'ninguna',
+        'RATE_LIMIT_RPS': '0',
+        'PRESUPUESTO_MENSUAL': '0',
+        'ARCHIVO_USO_API': os.path.join(trabajo, 'uso_api.json'),
+        'BACKOFF_BASE': '0.05',
+        'BACKOFF_MAX': '0.5',
+        'TAMANO_LOTE': '1',
+    })
+    sys.path.insert(0, DIRECTORIO)
+    import extractor as modulo
+    if con_logs:
+        modulo.configurar_logging(os.path.join(trabajo, 'logs'))
+
+    latencias: List[float] = []
+    hilos = 1 if modo == 'secuencial' else workers
+
+    inicio = time.perf_counter()
+    with modulo.WeatherstackExtractor(max_workers=hilos) as extractor:
+        if modo == 'async':
+            async def correr():
+                session = _sesion_aiohttp_medida(workers, latencias)
+                async with session:
+                    return await extractor.ejecutar_extraccion_async(workers, session=session)
+            datos = asyncio.run(correr())
+        else:
+            _medir_sesion_requests(extractor, latencias)
+            lote = tamano_lote if modo == 'lote' else 1
+            datos = extractor.ejecutar_extraccion(tamano_lote=lote)
+        fin_extraccion = time.perf_counter()
+
+        df = extractor.a_dataframe(datos)
+        extractor.guardar_csv(df, os.path.join(trabajo, 'clima.csv'))
+        extractor.guardar_json(df, os.path.join(trabajo, 'clima.json'))
+    # Los procesos de multiprocessing no corren atexit: vaciar la cola de logs
+    modulo.detener_logging()
+    total = time.perf_counter() - inicio
+
+    return {
+        'modo': modo,
+        'workers': hilos,
+        'ciudades': ciudades,
+        'registros': len(datos),
+        'llamadas_http': len(latencias),
+        'segundos_total': round(total, 4),
+        'segundos_extraccion': round(fin_extraccion - inicio, 4),
+        'segundos_guardado': round(total - (fin_extraccion - inicio), 4),
+        'registros_por_segundo': round(len(datos) / total, 2) if total else None,
+        'latencia_ms': {
+            nombre: round(valor * 1000, 2) if valor is not None else None
+            for nombre, valor in (('p50', percentil(latencias, 50)),
+                                  ('p95', percentil(latencias, 95)),
+                                  ('p99', percentil(latencias, 99)))
+        },
+        # En Linux ru_maxrss está en KiB (en macOS, en bytes)
+        'rss_pico_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss /
+                             (1024 * 1024 if sys.platform == 'darwin' else 1024), 1),
+    }
+
+
+def _escenario_en_proceso(cola, *args):
+    try:
+        cola.put(ejecutar_escenario(*args))
+    except Exception as e:
+        cola.put({'modo': args[0], 'error': f"{type(e).__name__}: {e}"})
+
+
+# ============================================================================
+# TIEMPO DE ARRANQUE
+# ============================================================================
+
+# Módulos que importar extractor no debe cargar (solo los usan algunos caminos)
+MODULOS_PESADOS = ('pandas', 'numpy', 'matplotlib', 'pyarrow', 'aiohttp')
+
+_CODIGO_ARRANQUE = '''
+import json, os, sys, time
+inicio = time.perf_counter()
+sys.path.insert(0, {directorio!r})
+import extractor
+segundos = time.perf_counter() - inicio
+print(json.dumps({{'segundos': segundos, 'archivos': sorted(os.listdir('.')),
+                  'pesados': [m for m in {pesados!r} if m in sys.modules]}}))
+'''
+
+
+def medir_arranque(repeticiones: int = 7) -> Dict[str, Any]:
+    """
+    Mide el tiempo de `import extractor` en procesos Python nuevos
+
+    Cada repetición corre en un intérprete recién creado y en un directorio
+    vacío, para detectar también efectos del import (logs/, archivos).
+
+    Args:
+        repeticiones: Procesos a lanzar
+
+    Returns:
+        Dict con el import y el proceso completo (p50/min/max en ms), los
+        módulos pesados cargados y los archivos creados
+    """
+    import subprocess
+
+    codigo = _CODIGO_ARRANQUE.format(directorio=DIRECTORIO, pesados=MODULOS_PESADOS)
+    imports, procesos = [], []
+    pesados, archivos = set(), set()
+    for _ in range(repeticiones):
+        with tempfile.TemporaryDirectory(prefix='bench_arranque_') as trabajo:
+            inicio = time.perf_counter()
+            salida = subprocess.run([sys.executable, '-c', codigo], cwd=trabajo,
+                                    capture_output=True, text=True, check=True).stdout
+            procesos.append(time.perf_counter() - inicio)
+        medicion = json.loads(salida.strip().splitlines()[-1])
+        imports.append(medicion['segundos'])
+        pesados.update(medicion['pesados'])
+        archivos.update(medicion['archivos'])
+
+    def resumen(valores: List[float]) -> Dict[str, float]:
+        return {'p50': round(percentil(valores, 50) * 1000, 1),
+                'min': round(min(valores) * 1000, 1), 'max': round(max(valores) * 1000, 1)}
+
+    return {
+        'repeticiones': repeticiones,
+        'import_ms': resumen(imports),
+        'proceso_ms': resumen(procesos),
+        'modulos_pesados': sorted(pesados),
+        'archivos_creados': sorted(archivos),
+    }
+
+
+def imprimir_arranque(arranque: Dict[str, Any], max_segundos: Optional[float] = None) -> bool:
+    """
+    Imprime el resultado de medir_arranque y verifica los límites
+
+    Returns:
+        True si no hay regresiones
+    """
+    print(f"\n{'':<20} {'p50 ms':>8} {'min ms':>8} {'max ms':>8}")
+    print("-" * 47)
+    for nombre, clave in (('import extractor', 'import_ms'), ('proceso completo', 'proceso_ms')):
+        m = arranque[clave]
+        print(f"{nombre:<20} {m['p50']:>8.1f} {m['min']:>8.1f} {m['max']:>8.1f}")
+
+    ok = True
+    if arranque['modulos_pesados']:
+        print(f"❌ El import carga módulos pesados: {', '.join(arranque['modulos_pesados'])}")
+        ok = False
+    if arranque['archivos_creados']:
+        print(f"❌ El import crea archivos: {', '.join(arranque['archivos_creados'])}")
+        ok = False
+    if max_segundos is not None and arranque['import_ms']['p50'] > max_segundos * 1000:
+        print(f"❌ El import tarda más de {max_segundos * 1000:.0f}ms")
+        ok = False
+    if ok:
+        print("✅ Arranque sin módulos pesados ni efectos secundarios")
+    return ok
+
+
+# ============================================================================
+# REPORTE Y COMPARACIÓN
+# ============================================================================
+
+def imprimir_resultados(resultados: List[Dict[str, Any]]):
+    """Imprime una tabla con las métricas de cada modo"""
+    print(f"\n{'Modo':<12} {'Workers':>7} {'Reg.':>6} {'Reg/s':>9} {'Total s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MB':>7}")
+    print("-" * 83)
+    for r in resultados:
+        if 'error' in r:
+            print(f"{r['modo']:<12} ❌ {r['error']}")
+            continue
+        lat = r['latencia_ms']
+        print(f"{r['modo']:<12} {r['workers']:>7} {r['registros']:>6} "
+              f"{r['registros_por_segundo']:>9.1f} {r['segundos_total']:>8.2f} "
+              f"{lat['p50'] or 0:>8.1f} {lat['p95'] or 0:>8.1f} {lat['p99'] or 0:>8.1f} "
+              f"{r['rss_pico_mb']:>7.1f}")
+
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any]):
+    """Imprime la variación de cada modo respecto a un resultado guardado"""
+    anteriores = {r['modo']: r for r in base.get('resultados', []) if 'error' not in r}
+    print(f"\n📈 Comparación con {base.get('version', '?')} ({base.get('fecha', '?')})")
+    print(f"{'Modo':<12}{'Reg/s':>25}{'p95 ms':>25}{'RSS MB':>25}")
+    print("-" * 87)
+
+    def variacion(nuevo, viejo) -> str:
+        if not nuevo or not viejo:
+            return f"{'-':>25}"
+        return f"{viejo:>9.1f} → {nuevo:<7.1f}{(nuevo - viejo) / viejo:>+6.0%}"
+
+    for r in actual['resultados']:
+        previo = anteriores.get(r['modo'])
+        if previo is None or 'error' in r:
+            continue
+        print(f"{r['modo']:<12}"
+              f"{variacion(r['registros_por_segundo'], previo['registros_por_segundo'])}"
+              f"{variacion(r['latencia_ms']['p95'], previo['latencia_ms']['p95'])}"
+              f"{variacion(r['rss_pico_mb'], previo['rss_pico_mb'])}")
+
+
+def version_actual() -> str:
+    """Commit de git del extractor, o 'desconocida' fuera de un repositorio"""
+    import subprocess
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIRECTORIO,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconocida'
+
+
+# ============================================================================
+# FUNCIÓN PRINCIPAL
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> bool:
+    parser = argparse.ArgumentParser(description='Benchmark del extractor ETL Weatherstack')
+    parser.add_argument('--ciudades', type=int, default=200, help='Ciudades por corrida')
+    parser.add_argument('--modos', nargs='+', choices=MODOS, default=['secuencial', 'concurrente'],
+                        help='Modos a comparar')
+    parser.add_argument('--workers', type=int, default=16,
+                        help='Hilos (o concurrencia async) de los modos paralelos')
+    parser.add_argument('--tamano-lote', type=int, default=10, help='Ciudades por solicitud en modo lote')
+    parser.add_argument('--latencia', type=float, default=0.05, help='Latencia simulada (s)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='Variación de latencia (± s)')
+    parser.add_argument('--error', type=float, default=0.0, help='Fracción de respuestas HTTP 500')
+    parser.add_argument('--payload', type=int, default=0, help='Bytes de relleno por respuesta')
+    parser.add_argument('--con-logs', action='store_true', help='Mantener el logging INFO del extractor')
+    parser.add_argument('--salida', help='Guardar resultados en este JSON')
+    parser.add_argument('--comparar', help='JSON de una corrida anterior para comparar')
+    parser.add_argument('--arranque', action='store_true',
+                        help='Medir solo el tiempo de import del extractor')
+    parser.add_argument('--repeticiones', type=int, default=7, help='Procesos para --arranque')
+    parser.add_argument('--max-arranque', type=float,
+                        help='Falla si el import (p50) supera estos segundos')
+    args = parser.parse_args(argv)
+
+    if args.arranque:
+        return _main_arranque(args)
+
+    print(f"🏁 Benchmark: {args.ciudades} ciudades, latencia {args.latencia * 1000:.0f}ms "
+          f"±{args.jitter * 1000:.0f}ms, error {args.error:.0%}, payload +{args.payload}B")
+
+    contexto = multiprocessing.get_context('spawn')
+    resultados = []
+    with ServidorWeatherstackFalso(args.latencia, args.jitter, args.error, args.payload) as servidor:
+        for modo in args.modos:
+            print(f"   ▶ {modo}...", flush=True)
+            cola = contexto.Queue()
+            proceso = contexto.Process(target=_escenario_en_proceso, args=(
+                cola, modo, servidor.url, args.ciudades, args.workers,
+                args.tamano_lote, args.con_logs))
+            proceso.start()
+            resultados.append(cola.get())
+            proceso.join()
+
+    imprimir_resultados(resultados)
+
+    reporte = {
+        'version': version_actual(),
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'parametros': vars(args),
+        'resultados': resultados,
+    }
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            comparar(reporte, json.load(f))
+    if args.salida:
+        os.makedirs(os.path.dirname(args.salida) or '.', exist_ok=True)
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados: {args.salida}")
+
+    return all('error' not in r for r in resultados)
+
+
+def _main_arranque(args) -> bool:
+    """Benchmark de arranque: mide, compara con --comparar y guarda en --salida"""
+    print(f"🏁 Arranque: import extractor en {args.repeticiones} procesos nuevos")
+    arranque = medir_arranque(args.repeticiones)
+    ok = imprimir_arranque(arranque, args.max_arranque)
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        previo = base.get('arranque')
+        if previo:
+            viejo, nuevo = previo['import_ms']['p50'], arranque['import_ms']['p50']
+            print(f"\n📈 import p50 vs {base.get('version', '?')}: {viejo:.1f} → {nuevo:.1f} ms "
+                  f"({(nuevo - viejo) / viejo:+.0%})")
+    if args.salida:
+        reporte = {
+            'version': version_actual(),
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'arranque': arranque,
+        }
+        os.makedirs(os.path.dirname(args.salida) or '.', exist_ok=True)
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados: {args.salida}")
+    return ok
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Escenas declarativas de los diagramas del pipeline ETL Weatherstack
+
+Cada escena es un dict (equivalente a un archivo JSON/YAML) que
+DiagramaETL.renderizar_escena dibuja con un único motor:
+
+    titulo / subtitulo   Textos centrados arriba
+    limites              [xmin, xmax, ymin, ymax] de los ejes
+    tamano               [ancho, alto] de la figura en pulgadas
+    nodos                Cajas: id, x, y (centro), ancho, alto, texto, color
+                         (nombre de la paleta: api, extract, transform, load,
+                         data, o un color de matplotlib) y fontsize
+    aristas              Flechas: desde / hasta (id de nodo o [x, y]) y etiqueta
+    textos               Textos sueltos: x, y, texto y opciones de ax.text
+                         (fontsize, fontweight, ha, style, color, family);
+                         'caja' dibuja un recuadro (facecolor, edgecolor, alpha)
+    listas               Columnas de líneas: x, y (del título), titulo, lineas,
+                         paso entre líneas, separacion título-primera línea,
+                         fontsize, titulo_fontsize y color
+
+Los textos pueden usar campos {asi} y una lista puede ser '$nombre'; ambos
+se completan con el contexto que recibe renderizar_escena: aquí, los valores
+medidos en la última corrida (DiagramaETL._textos_metricas).
+"""
+
+ESCENA_FLUJO_PRINCIPAL = {
+    'titulo': 'ARQUITECTURA DEL PIPELINE ETL - WEATHERSTACK',
+    'subtitulo': 'Extracción → Transformación → Carga → Análisis',
+    'nodos': [
+        {'id': 'api', 'x': 5, 'y': 7.8, 'ancho': 2, 'alto': 0.8,
+         'texto': 'Weatherstack API\n(Datos de Clima)', 'color': 'api'},
+        {'id': 'extract', 'x': 5, 'y': 6.2, 'ancho': 2.5, 'alto': 0.8,
+         'texto': '📥 EXTRACT\nextractor.py', 'color': 'extract'},
+        {'id': 'transform', 'x': 5, 'y': 4.6, 'ancho': 2.5, 'alto': 0.8,
+         'texto': '⚙️ TRANSFORM\nprocesar_respuesta()', 'color': 'transform'},
+        {'id': 'load', 'x': 5, 'y': 3, 'ancho': 2.5, 'alto': 0.8,
+         'texto': '💾 LOAD\nGuardar datos', 'color': 'load'},
+    ],
+    'aristas': [
+        {'desde': 'api', 'hasta': 'extract'},
+        {'desde': 'extract', 'hasta': 'transform'},
+        {'desde': 'transform', 'hasta': 'load'},
+        {'desde': [3.5, 2.6], 'hasta': [0.3, 1.8], 'etiqueta': 'clima.csv'},
+        {'desde': [5, 2.6], 'hasta': [5, 1.8], 'etiqueta': 'clima_raw.json'},
+        {'desde': [6.5, 2.6], 'hasta': [9.7, 1.8], 'etiqueta': 'análisis.png'},
+    ],
+    'listas': [
+        {'x': 0.5, 'y': 5.5, 'titulo': 'Proceso:',
+         'lineas': ['• Conectar a API', '• 5 ciudades', '• Validar', '• Logging']},
+        {'x': 9.2, 'y': 5.5, 'titulo': 'Proceso:',
+         'lineas': ['• Normalizar', '• Limpiar', '• Enriquecer', '• Validar tipos']},
+    ],
+    'textos': [
+        {'x': 0.3, 'y': 2.2, 'texto': 'CSV', 'fontsize': 8, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.7}},
+        {'x': 5, 'y': 2.2, 'texto': 'JSON', 'fontsize': 8, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.7}},
+        {'x': 9.7, 'y': 2.2, 'texto': 'PNG', 'fontsize': 8, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.7}},
+        {'x': 5, 'y': 0.8, 'texto': '✅ DATOS LISTOS PARA ANÁLISIS Y BI',
+         'fontsize': 11, 'fontweight': 'bold', 'ha': 'center',
+         'caja': {'facecolor': '#C8E6C9', 'edgecolor': '#27AE60', 'linewidth': 2}},
+        {'x': 0.5, 'y': 0.2, 'texto': '⏱️ Duración: {duracion}', 'fontsize': 8, 'style': 'italic'},
+        {'x': 5, 'y': 0.2, 'texto': '📊 Volumen: {volumen}', 'fontsize': 8, 'style': 'italic'},
+        {'x': 9.2, 'y': 0.2, 'texto': '🔄 Frecuencia: Manual', 'fontsize': 8, 'style': 'italic'},
+    ],
+}
+
+ESCENA_COMPONENTES = {
+    'titulo': 'COMPONENTES DEL SISTEMA ETL',
+    'nodos': [
+        {'id': 'config', 'x': 2, 'y': 8, 'ancho': 1.8, 'alto': 0.8,
+         'texto': '.env\nVariables', 'color': '#FFE66D'},
+        {'id': 'api', 'x': 5, 'y': 8, 'ancho': 1.8, 'alto': 0.8,
+         'texto': 'API\nWeatherstack', 'color': '#A8E6CF'},
+        {'id': 'seguridad', 'x': 8, 'y': 8, 'ancho': 1.8, 'alto': 0.8,
+         'texto': '🔒 Seguridad\nAPI Key', 'color': '#FF9999'},
+        {'id': 'extractor', 'x': 2, 'y': 6, 'ancho': 1.8, 'alto': 0.8,
+         'texto': 'extractor.py\nClase Principal', 'color': 'extract'},
+        {'id': 'procesador', 'x': 5, 'y': 6, 'ancho': 1.8, 'alto': 0.8,
+         'texto': 'procesar()\nNormalización', 'color': 'transform'},
+        {'id': 'logger', 'x': 8, 'y': 6, 'ancho': 1.8, 'alto': 0.8,
+         'texto': 'logging\nRegistros', 'color': '#B3E5FC'},
+        {'id': 'csv', 'x': 1.5, 'y': 4, 'ancho': 1.5, 'alto': 0.8,
+         'texto': 'CSV\nTabular', 'color': 'data'},
+        {'id': 'json', 'x': 3.5, 'y': 4, 'ancho': 1.5, 'alto': 0.8,
+         'texto': 'JSON\nEstructurado', 'color': 'data'},
+        {'id': 'png', 'x': 5.5, 'y': 4, 'ancho': 1.5, 'alto': 0.8,
+         'texto': 'PNG\nGráficas', 'color': 'data'},
+        {'id': 'log', 'x': 7.5, 'y': 4, 'ancho': 1.5, 'alto': 0.8,
+         'texto': 'LOG\nRegistros', 'color': '#FFCCBC'},
+        {'id': 'git', 'x': 5, 'y': 2, 'ancho': 2, 'alto': 0.8,
+         'texto': 'Git/GitHub\nControl de Versiones', 'color': '#E1BEE7'},
+        {'id': 'analisis', 'x': 5, 'y': 0.5, 'ancho': 2.5, 'alto': 0.8,
+         'texto': '📊 Pandas + Matplotlib\nAnálisis y Visualización', 'color': '#C8E6C9'},
+    ],
+    'aristas': [
+        {'desde': 'config', 'hasta': 'extractor'},
+        {'desde': 'api', 'hasta': 'procesador'},
+        {'desde': 'seguridad', 'hasta': 'logger'},
+        {'desde': 'extractor', 'hasta': 'csv'},
+        {'desde': 'procesador', 'hasta': 'json'},
+        {'desde': 'procesador', 'hasta': 'png'},
+        {'desde': 'logger', 'hasta': 'log'},
+        {'desde': 'csv', 'hasta': 'git'},
+        {'desde': 'log', 'hasta': 'git'},
+        {'desde': 'git', 'hasta': 'analisis'},
+    ],
+}
+
+ESCENA_FLUJO_DATOS = {
+    'titulo': 'FLUJO DE DATOS DETALLADO',
+    'aristas': [
+        {'desde': [2, 7.2], 'hasta': [5, 6.8]},
+        {'desde': [5, 7.2], 'hasta': [8, 6.8]},
+        {'desde': [5, 6.2], 'hasta': [1, 5.9]},
+        {'desde': [5, 6.2], 'hasta': [5, 5.9]},
+        {'desde': [5, 6.2], 'hasta': [9, 5.9]},
+    ],
+    'textos': [
+        # Etapas
+        {'x': 1.5, 'y': 8.8, 'texto': 'ETAPA 1: API Response', 'fontsize': 9, 'fontweight': 'bold'},
+        {'x': 1.5, 'y': 8.3, 'texto': 'Formato JSON:\n{', 'fontsize': 8, 'family': 'monospace',
+         'caja': {'facecolor': '#FFE66D', 'alpha': 0.7}},
+        {'x': 1.5, 'y': 7.6, 'texto': '"current": {...},\n"location": {...}', 'fontsize': 7,
+         'family': 'monospace'},
+        {'x': 5.5, 'y': 8.8, 'texto': 'ETAPA 2: Extracción', 'fontsize': 9, 'fontweight': 'bold'},
+        {'x': 5.5, 'y': 8.3, 'texto': 'Campos relevantes:\n- temperatura\n- humedad\n- ciudad\n- timestamp',
+         'fontsize': 8},
+        {'x': 8.5, 'y': 8.8, 'texto': 'ETAPA 3: Normalizado', 'fontsize': 9, 'fontweight': 'bold'},
+        {'x': 8.5, 'y': 8.3, 'texto': 'Tipos consistentes:\n- Números\n- Strings\n- Timestamps',
+         'fontsize': 8},
+        # Salidas
+        {'x': 1, 'y': 5.5, 'texto': 'CSV (Tabular)', 'fontsize': 10, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.8}},
+        {'x': 1, 'y': 5, 'texto': 'ciudad,temp,humedad\nBogota,22,65\nMedellin,24,70',
+         'fontsize': 7, 'family': 'monospace', 'caja': {'facecolor': 'white', 'alpha': 0.8}},
+        {'x': 5, 'y': 5.5, 'texto': 'JSON (Estructurado)', 'fontsize': 10, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.8}},
+        {'x': 5, 'y': 5, 'texto': '[{\n  "ciudad":"Bogota",\n  "temp":22\n}]',
+         'fontsize': 7, 'family': 'monospace', 'caja': {'facecolor': 'white', 'alpha': 0.8}},
+        {'x': 9, 'y': 5.5, 'texto': 'PNG (Visualizado)', 'fontsize': 10, 'fontweight': 'bold',
+         'caja': {'facecolor': 'data', 'alpha': 0.8}},
+        {'x': 8.3, 'y': 4.7, 'texto': '📊\n[Gráficos]', 'fontsize': 9,
+         'caja': {'facecolor': 'white', 'alpha': 0.8}},
+        # Pie
+        {'x': 5, 'y': 0.2, 'texto': '🔄 Este flujo se repite cada ejecución del script extractor.py',
+         'fontsize': 9, 'style': 'italic', 'ha': 'center'},
+    ],
+    'listas': [
+        {'x': 2, 'y': 4, 'titulo': '📊 ESTADÍSTICAS', 'titulo_fontsize': 10,
+         'separacion': 1, 'paso': 0.35, 'lineas': [
+            '• Ciudades: 5',
+            '• Campos por ciudad: 10',
+            '• Registros por ejecución: ~5',
+            '• Tamaño CSV: ~2-5 KB',
+            '• Tamaño JSON: ~3-8 KB',
+        ]},
+        {'x': 5.5, 'y': 4, 'titulo': '✅ CALIDAD DE DATOS', 'titulo_fontsize': 10,
+         'separacion': 1, 'paso': 0.35, 'color': '#27AE60', 'lineas': [
+            '✓ Sin valores nulos',
+            '✓ Tipos consistentes',
+            '✓ Rangos válidos',
+            '✓ Timestamps consistentes',
+            '✓ Duplicados detectados',
+        ]},
+        {'x': 8, 'y': 4, 'titulo': '⚡ PERFORMANCE', 'titulo_fontsize': 10,
+         'separacion': 1, 'paso': 0.35, 'lineas': '$rendimiento'},
+    ],
+}
@@ -2,26 +2,112 @@
 """
 Módulo para visualizar la arquitectura del pipeline ETL Weatherstack
 Genera diagramas de flujo del proceso de extracción, transformación y carga de datos
+
+Los diagramas usan la API orientada a objetos de matplotlib (Figure +
+FigureCanvasAgg) sin pyplot: no hay estado global compartido ni se necesita
+display, así que se pueden renderizar en paralelo en procesos separados.
+
+Los diagramas de arquitectura son datos (escenas en escenas_etl.py o en un
+archivo JSON/YAML) que dibuja un único motor, renderizar_escena.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
+import os
+import re
+import time
+import hashlib
+import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.collections import PatchCollection, LineCollection
+import matplotlib.dates as mdates
+from matplotlib.ticker import MaxNLocator
 import numpy as np
+import json
+from datetime import datetime
 from pathlib import Path
+from escenas_etl import ESCENA_FLUJO_PRINCIPAL, ESCENA_COMPONENTES, ESCENA_FLUJO_DATOS
 
 class DiagramaETL:
     """Genera visualizaciones de la arquitectura del ETL"""
     
-    def __init__(self, output_dir='data'):
+    # (método, nombre de archivo sin extensión, descripción) de cada diagrama
+    # que genera generar_todos_diagramas; para agregar uno basta con sumarlo aquí
+    DIAGRAMAS = [
+        ('diagrama_flujo_principal', 'etl_flujo_principal', 'Flujo general del ETL'),
+        ('diagrama_componentes', 'etl_componentes', 'Componentes del sistema'),
+        ('diagrama_flujo_datos', 'etl_flujo_datos', 'Transformación de datos'),
+        ('diagrama_rendimiento', 'etl_rendimiento', 'Rendimiento medido (si hay métricas)'),
+    ]
+    
+    # Perfiles de salida: formato, dpi por defecto y sufijo del archivo
+    #   png      raster de alta resolución (comportamiento histórico)
+    #   preview  PNG liviano para iterar rápido sobre los diagramas
+    #   svg/pdf  vectoriales para publicación y para embeber en el HTML
+    #   webp     raster comprimido para la web
+    PERFILES = {
+        'png': ('png', 300, ''),
+        'preview': ('png', 72, '_preview'),
+        'svg': ('svg', 72, ''),
+        'pdf': ('pdf', 72, ''),
+        'webp': ('webp', 150, ''),
+    }
+    
+    # Método que devuelve los datos que dibuja cada diagrama (para la huella
+    # de la caché de render); los que no figuran aquí son estáticos. Los
+    # diagramas de arquitectura solo dependen de la última corrida medida
+    DATOS_DIAGRAMA = {
+        'diagrama_flujo_principal': '_textos_metricas',
+        'diagrama_flujo_datos': '_textos_metricas',
+        'diagrama_rendimiento': '_contenido_metricas',
+    }
+    
+    # Escena declarativa que dibuja cada diagrama (también entra en la huella)
+    ESCENAS = {
+        'diagrama_flujo_principal': ESCENA_FLUJO_PRINCIPAL,
+        'diagrama_componentes': ESCENA_COMPONENTES,
+        'diagrama_flujo_datos': ESCENA_FLUJO_DATOS,
+    }
+    
+    # Métodos compartidos cuyo código también forma parte de la huella
+    AUXILIARES = ('nueva_figura', 'guardar_figura', 'renderizar_escena', 'dibujar_escena',
+                  '_color', '_completar', '_punto_borde', '_dibujar_flechas', 'cargar_metricas',
+                  '_throughput', '_textos_metricas')
+    
+    # Estilo de las escenas: relleno de las cajas y flechas '->' (en puntos,
+    # como FancyArrowPatch con mutation_scale=30)
+    PAD_CAJA = 0.1
+    PUNTA_LARGO = 12
+    PUNTA_ANCHO = 6
+    RECORTE_FLECHA = 2
+    
+    def __init__(self, output_dir='data', metricas_dir=None, perfil='png', dpi=None):
         """
         Inicializa el generador de diagramas
         
         Args:
             output_dir (str): Directorio donde guardar las imágenes
+            metricas_dir (str): Directorio con los metricas_*.json del extractor
+                (por defecto <output_dir>/metricas)
+            perfil (str): Perfil de salida de PERFILES (png, preview, svg, pdf, webp)
+            dpi (int): Resolución (por defecto la del perfil)
+            
+        Raises:
+            ValueError: Si el perfil no existe
         """
+        if perfil not in self.PERFILES:
+            raise ValueError(f"❌ Perfil desconocido: {perfil} (opciones: {', '.join(self.PERFILES)})")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.metricas_dir = Path(metricas_dir) if metricas_dir else self.output_dir / 'metricas'
+        self.perfil = perfil
+        self.formato, dpi_perfil, self.sufijo = self.PERFILES[perfil]
+        self.dpi = dpi or dpi_perfil
+        self.archivo_cache = self.output_dir / '.diagramas_cache.json'
         
         # Colores
         self.color_extract = '#FF6B6B'
@@ -30,345 +116,606 @@ class DiagramaETL:
         self.color_data = '#FFE66D'
         self.color_api = '#A8E6CF'
     
-    def dibujar_caja(self, ax, x, y, ancho, alto, texto, color, fontsize=10):
-        """Dibuja una caja redondeada con texto"""
-        box = FancyBboxPatch(
-            (x - ancho/2, y - alto/2), ancho, alto,
-            boxstyle="round,pad=0.1",
-            edgecolor='black', facecolor=color,
-            linewidth=2, alpha=0.8
-        )
-        ax.add_patch(box)
-        ax.text(x, y, texto, ha='center', va='center',
-                fontsize=fontsize, fontweight='bold',
-                wrap=True)
-    
-    def dibujar_flecha(self, ax, x1, y1, x2, y2, etiqueta=''):
-        """Dibuja una flecha entre dos puntos"""
-        arrow = FancyArrowPatch(
-            (x1, y1), (x2, y2),
-            arrowstyle='->', mutation_scale=30,
-            linewidth=2.5, color='#333333'
-        )
-        ax.add_patch(arrow)
-        
-        # Etiqueta de la flecha
-        if etiqueta:
-            mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-            ax.text(mid_x + 0.3, mid_y + 0.3, etiqueta,
-                   fontsize=8, style='italic',
-                   bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    @staticmethod
+    def nueva_figura(figsize=(14, 10)):
+        """Crea una Figure con canvas Agg propio (sin pasar por pyplot)"""
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
     
-    def diagrama_flujo_principal(self):
-        """Crea el diagrama de flujo principal del ETL"""
-        fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-        
-        # Configurar ejes
-        ax.set_xlim(-0.5, 10)
-        ax.set_ylim(-0.5, 10)
-        ax.axis('off')
+    def archivo(self, nombre):
+        """Ruta de salida de un diagrama según el perfil"""
+        return self.output_dir / f'{nombre}{self.sufijo}.{self.formato}'
+    
+    def guardar_figura(self, fig, nombre):
+        """
+        Guarda la figura con el formato y dpi del perfil
         
-        # Título
-        ax.text(5, 9.5, 'ARQUITECTURA DEL PIPELINE ETL - WEATHERSTACK',
-               fontsize=16, fontweight='bold', ha='center')
-        ax.text(5, 9, 'Extracción → Transformación → Carga → Análisis',
-               fontsize=11, ha='center', style='italic', color='#555')
-        
-        # LAYER 1: ORIGEN DE DATOS
-        self.dibujar_caja(ax, 5, 7.8, 2, 0.8, 
-                         'Weatherstack API\n(Datos de Clima)',
-                         self.color_api, fontsize=9)
-        
-        # Flecha 1
-        self.dibujar_flecha(ax, 5, 7.4, 5, 6.8, '')
-        
-        # LAYER 2: EXTRACCIÓN
-        self.dibujar_caja(ax, 5, 6.2, 2.5, 0.8,
-                         '📥 EXTRACT\nextractor.py',
-                         self.color_extract, fontsize=9)
-        
-        # Proceso detallado de extracción
-        ax.text(0.5, 5.5, 'Proceso:',
-               fontsize=9, fontweight='bold')
-        ax.text(0.5, 5.1, '• Conectar a API', fontsize=8)
-        ax.text(0.5, 4.7, '• 5 ciudades', fontsize=8)
-        ax.text(0.5, 4.3, '• Validar', fontsize=8)
-        ax.text(0.5, 3.9, '• Logging', fontsize=8)
-        
-        # Flecha 2
-        self.dibujar_flecha(ax, 5, 5.8, 5, 5.2, '')
-        
-        # LAYER 3: TRANSFORMACIÓN
-        self.dibujar_caja(ax, 5, 4.6, 2.5, 0.8,
-                         '⚙️ TRANSFORM\nprocesar_respuesta()',
-                         self.color_transform, fontsize=9)
-        
-        # Proceso detallado de transformación
-        ax.text(9.2, 5.5, 'Proceso:',
-               fontsize=9, fontweight='bold')
-        ax.text(9.2, 5.1, '• Normalizar', fontsize=8)
-        ax.text(9.2, 4.7, '• Limpiar', fontsize=8)
-        ax.text(9.2, 4.3, '• Enriquecer', fontsize=8)
-        ax.text(9.2, 3.9, '• Validar tipos', fontsize=8)
-        
-        # Flecha 3
-        self.dibujar_flecha(ax, 5, 4.2, 5, 3.6, '')
-        
-        # LAYER 4: CARGA/ALMACENAMIENTO
-        self.dibujar_caja(ax, 5, 3, 2.5, 0.8,
-                         '💾 LOAD\nGuardar datos',
-                         self.color_load, fontsize=9)
-        
-        # Tres salidas paralelas
-        ax.text(0.3, 2.2, 'CSV', fontsize=8, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.7))
-        ax.text(5, 2.2, 'JSON', fontsize=8, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.7))
-        ax.text(9.7, 2.2, 'PNG', fontsize=8, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.7))
-        
-        # Flechas hacia salidas
-        self.dibujar_flecha(ax, 3.5, 2.6, 0.3, 1.8, 'clima.csv')
-        self.dibujar_flecha(ax, 5, 2.6, 5, 1.8, 'clima_raw.json')
-        self.dibujar_flecha(ax, 6.5, 2.6, 9.7, 1.8, 'análisis.png')
-        
-        # LAYER 5: RESULTADO
-        ax.text(5, 0.8, '✅ DATOS LISTOS PARA ANÁLISIS Y BI',
-               fontsize=11, fontweight='bold', ha='center',
-               bbox=dict(boxstyle='round', facecolor='#C8E6C9', 
-                        edgecolor='#27AE60', linewidth=2))
-        
-        # Leyenda de duración
-        ax.text(0.5, 0.2, '⏱️ Duración: ~2-5 segundos por ejecución',
-               fontsize=8, style='italic')
-        ax.text(5, 0.2, '📊 Volumen: ~100-200 registros',
-               fontsize=8, style='italic')
-        ax.text(9.2, 0.2, '🔄 Frecuencia: Manual',
-               fontsize=8, style='italic')
-        
-        plt.tight_layout()
-        output_file = self.output_dir / 'etl_flujo_principal.png'
-        plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+        En SVG el texto se guarda como texto (no como trazos), lo que reduce
+        mucho el tamaño y permite buscarlo en el HTML.
+        """
+        output_file = self.archivo(nombre)
+        with matplotlib.rc_context({'svg.fonttype': 'none'}):
+            fig.savefig(output_file, format=self.formato, dpi=self.dpi,
+                        bbox_inches='tight', facecolor='white')
         print(f"✅ Diagrama guardado: {output_file}")
-        plt.close()
+        return output_file
     
-    def diagrama_componentes(self):
-        """Crea un diagrama de componentes del sistema"""
-        fig, ax = plt.subplots(1, 1, figsize=(14, 10))
+    @staticmethod
+    def cargar_escena(ruta):
+        """
+        Lee una escena declarativa desde un archivo JSON o YAML
+        
+        Args:
+            ruta (str): Archivo .json, .yaml o .yml (ver escenas_etl.py)
+            
+        Returns:
+            dict: Escena lista para renderizar_escena
+            
+        Raises:
+            ImportError: Si es YAML y PyYAML no está instalado
+        """
+        ruta = Path(ruta)
+        with open(ruta, 'r', encoding='utf-8') as f:
+            if ruta.suffix.lower() in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError("❌ Leer escenas YAML requiere PyYAML: pip install pyyaml")
+                return yaml.safe_load(f)
+            return json.load(f)
+    
+    def _color(self, valor):
+        """Color de la paleta (api, extract, transform, load, data) o de matplotlib"""
+        return getattr(self, f'color_{valor}', valor)
+    
+    @staticmethod
+    def _completar(texto, contexto):
+        """Reemplaza los campos {nombre} presentes en el contexto (el resto queda igual)"""
+        return re.sub(r'\{(\w+)\}', lambda m: str(contexto.get(m.group(1), m.group(0))), texto)
+    
+    def _punto_borde(self, nodo, hacia):
+        """Punto del borde de la caja (con su relleno) en dirección a otro punto"""
+        dx, dy = hacia[0] - nodo['x'], hacia[1] - nodo['y']
+        medio_ancho = nodo['ancho'] / 2 + self.PAD_CAJA
+        medio_alto = nodo['alto'] / 2 + self.PAD_CAJA
+        escala = min(medio_ancho / abs(dx) if dx else np.inf,
+                     medio_alto / abs(dy) if dy else np.inf)
+        if escala >= 1:
+            return nodo['x'], nodo['y']
+        return nodo['x'] + dx * escala, nodo['y'] + dy * escala
+    
+    def dibujar_escena(self, ax, escena, contexto=None):
+        """
+        Dibuja una escena declarativa en unos ejes
         
-        ax.set_xlim(-0.5, 10)
-        ax.set_ylim(-0.5, 10)
+        Las cajas van en una sola PatchCollection y las flechas en una sola
+        LineCollection, así el costo de dibujo no crece con un artista por
+        elemento. Las flechas se agregan al final porque sus puntas se
+        calculan en pulgadas: llamar a fig.tight_layout() antes.
+        
+        Args:
+            ax: Ejes de matplotlib
+            escena (dict): Escena (ver escenas_etl.py)
+            contexto (dict): Valores para los campos {nombre} y listas '$nombre'
+            
+        Returns:
+            function: Dibuja las flechas una vez fijada la posición de los ejes
+        """
+        contexto = contexto or {}
+        xmin, xmax, ymin, ymax = escena.get('limites', (-0.5, 10, -0.5, 10))
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
         ax.axis('off')
         
-        # Título
-        ax.text(5, 9.5, 'COMPONENTES DEL SISTEMA ETL',
-               fontsize=16, fontweight='bold', ha='center')
-        
-        # CONFIGURACIÓN
-        self.dibujar_caja(ax, 2, 8, 1.8, 0.8, '.env\nVariables',
-                         '#FFE66D', fontsize=9)
-        
-        # FUENTE DE DATOS
-        self.dibujar_caja(ax, 5, 8, 1.8, 0.8, 'API\nWeatherstack',
-                         '#A8E6CF', fontsize=9)
-        
-        # SEGURIDAD
-        self.dibujar_caja(ax, 8, 8, 1.8, 0.8, '🔒 Seguridad\nAPI Key',
-                         '#FF9999', fontsize=9)
-        
-        # EXTRACTOR
-        self.dibujar_caja(ax, 2, 6, 1.8, 0.8, 'extractor.py\nClase Principal',
-                         self.color_extract, fontsize=9)
-        
-        # PROCESADOR
-        self.dibujar_caja(ax, 5, 6, 1.8, 0.8, 'procesar()\nNormalización',
-                         self.color_transform, fontsize=9)
-        
-        # LOGGER
-        self.dibujar_caja(ax, 8, 6, 1.8, 0.8, 'logging\nRegistros',
-                         '#B3E5FC', fontsize=9)
-        
-        # ALMACENAMIENTO
-        self.dibujar_caja(ax, 1.5, 4, 1.5, 0.8, 'CSV\nTabular',
-                         self.color_data, fontsize=9)
-        self.dibujar_caja(ax, 3.5, 4, 1.5, 0.8, 'JSON\nEstructurado',
-                         self.color_data, fontsize=9)
-        self.dibujar_caja(ax, 5.5, 4, 1.5, 0.8, 'PNG\nGráficas',
-                         self.color_data, fontsize=9)
-        self.dibujar_caja(ax, 7.5, 4, 1.5, 0.8, 'LOG\nRegistros',
-                         '#FFCCBC', fontsize=9)
-        
-        # VERSIONAMIENTO
-        self.dibujar_caja(ax, 5, 2, 2, 0.8, 'Git/GitHub\nControl de Versiones',
-                         '#E1BEE7', fontsize=9)
-        
-        # ANÁLISIS
-        self.dibujar_caja(ax, 5, 0.5, 2.5, 0.8, '📊 Pandas + Matplotlib\nAnálisis y Visualización',
-                         '#C8E6C9', fontsize=9)
-        
-        # Flechas de flujo
-        self.dibujar_flecha(ax, 2, 7.6, 2, 6.4)  # Config a extractor
-        self.dibujar_flecha(ax, 5, 7.6, 5, 6.4)  # API a procesador
-        self.dibujar_flecha(ax, 8, 7.6, 8, 6.4)  # Seguridad a logger
-        
-        # Flechas de salida
-        self.dibujar_flecha(ax, 2, 5.6, 1.5, 4.4)
-        self.dibujar_flecha(ax, 5, 5.6, 3.5, 4.4)
-        self.dibujar_flecha(ax, 5, 5.6, 5.5, 4.4)
-        self.dibujar_flecha(ax, 8, 5.6, 7.5, 4.4)
-        
-        # Flechas hacia Git
-        self.dibujar_flecha(ax, 1.5, 3.6, 4.5, 2.4)
-        self.dibujar_flecha(ax, 7.5, 3.6, 5.5, 2.4)
-        
-        # Flecha hacia análisis
-        self.dibujar_flecha(ax, 5, 1.6, 5, 0.9)
-        
-        plt.tight_layout()
-        output_file = self.output_dir / 'etl_componentes.png'
-        plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✅ Diagrama guardado: {output_file}")
-        plt.close()
+        centro = (xmin + xmax) / 2
+        if escena.get('titulo'):
+            ax.text(centro, ymax - 0.5, self._completar(escena['titulo'], contexto),
+                    fontsize=16, fontweight='bold', ha='center')
+        if escena.get('subtitulo'):
+            ax.text(centro, ymax - 1, self._completar(escena['subtitulo'], contexto),
+                    fontsize=11, ha='center', style='italic', color='#555')
+        
+        # Cajas: una sola colección
+        nodos = {nodo['id']: nodo for nodo in escena.get('nodos', [])}
+        cajas = [FancyBboxPatch((n['x'] - n['ancho']/2, n['y'] - n['alto']/2), n['ancho'], n['alto'],
+                                boxstyle=f"round,pad={self.PAD_CAJA}")
+                 for n in nodos.values()]
+        if cajas:
+            ax.add_collection(PatchCollection(
+                cajas, facecolors=[self._color(n.get('color', 'data')) for n in nodos.values()],
+                edgecolors='black', linewidths=2, alpha=0.8))
+        for n in nodos.values():
+            ax.text(n['x'], n['y'], self._completar(n.get('texto', ''), contexto),
+                    ha='center', va='center', fontsize=n.get('fontsize', 9),
+                    fontweight='bold', wrap=True)
+        
+        # Textos sueltos y listas
+        for t in escena.get('textos', []):
+            opciones = {k: v for k, v in t.items() if k not in ('x', 'y', 'texto', 'caja')}
+            if 'color' in opciones:
+                opciones['color'] = self._color(opciones['color'])
+            if 'caja' in t:
+                caja = dict(t['caja'])
+                if 'facecolor' in caja:
+                    caja['facecolor'] = self._color(caja['facecolor'])
+                opciones['bbox'] = dict(boxstyle='round', **caja)
+            ax.text(t['x'], t['y'], self._completar(t['texto'], contexto), **opciones)
+        
+        for lista in escena.get('listas', []):
+            lineas = lista['lineas']
+            if isinstance(lineas, str) and lineas.startswith('$'):
+                lineas = contexto.get(lineas[1:], [])
+            paso = lista.get('paso', 0.4)
+            ax.text(lista['x'], lista['y'], lista['titulo'],
+                    fontsize=lista.get('titulo_fontsize', 9), fontweight='bold')
+            primera = lista['y'] - lista.get('separacion', paso)
+            for i, linea in enumerate(lineas):
+                ax.text(lista['x'], primera - i * paso, self._completar(linea, contexto),
+                        fontsize=lista.get('fontsize', 8), color=self._color(lista.get('color', 'black')))
+        
+        # Flechas: extremos en el borde de las cajas, etiquetas como texto
+        def punto(ref):
+            return (nodos[ref]['x'], nodos[ref]['y']) if isinstance(ref, str) else tuple(ref)
+        
+        flechas = []
+        for arista in escena.get('aristas', []):
+            desde, hasta = arista['desde'], arista['hasta']
+            origen, destino = punto(desde), punto(hasta)
+            if isinstance(desde, str):
+                origen = self._punto_borde(nodos[desde], punto(hasta))
+            if isinstance(hasta, str):
+                destino = self._punto_borde(nodos[hasta], punto(desde))
+            flechas.append((origen, destino))
+            if arista.get('etiqueta'):
+                ax.text((origen[0] + destino[0]) / 2 + 0.3, (origen[1] + destino[1]) / 2 + 0.3,
+                        self._completar(arista['etiqueta'], contexto), fontsize=8, style='italic',
+                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+        
+        return lambda: self._dibujar_flechas(ax, flechas)
+    
+    def _dibujar_flechas(self, ax, flechas):
+        """
+        Agrega todas las flechas '->' como una sola LineCollection
+        
+        La punta se calcula en pulgadas para que se vea igual que la de
+        FancyArrowPatch sin importar la escala de los ejes ni el dpi.
+        """
+        if not flechas:
+            return
+        posicion = ax.get_position()
+        ancho_fig, alto_fig = ax.figure.get_size_inches()
+        (xmin, xmax), (ymin, ymax) = ax.get_xlim(), ax.get_ylim()
+        escala = np.array([posicion.width * ancho_fig / (xmax - xmin),
+                           posicion.height * alto_fig / (ymax - ymin)])
+        
+        puntos = np.asarray(flechas, dtype=float) * escala  # (n, 2, 2) en pulgadas
+        direccion = puntos[:, 1] - puntos[:, 0]
+        largo = np.hypot(direccion[:, 0], direccion[:, 1])[:, None]
+        unitario = np.divide(direccion, largo, out=np.zeros_like(direccion), where=largo > 0)
+        normal = unitario[:, ::-1] * [-1, 1]
+        
+        recorte = self.RECORTE_FLECHA / 72
+        inicio = puntos[:, 0] + unitario * recorte
+        punta = puntos[:, 1] - unitario * recorte
+        base = punta - unitario * (self.PUNTA_LARGO / 72)
+        ala = normal * (self.PUNTA_ANCHO / 72)
+        
+        astiles = np.stack([inicio, punta], axis=1) / escala
+        puntas = np.stack([base + ala, punta, base - ala], axis=1) / escala
+        segmentos = list(astiles) + list(puntas)
+        ax.add_collection(LineCollection(segmentos, colors='#333333', linewidths=2.5,
+                                         capstyle='round', joinstyle='round'))
+    
+    def renderizar_escena(self, escena, nombre, contexto=None):
+        """
+        Renderiza una escena declarativa y la guarda con el perfil actual
+        
+        Args:
+            escena (dict): Escena (ver escenas_etl.py o cargar_escena)
+            nombre (str): Nombre del archivo sin extensión
+            contexto (dict): Valores para los campos {nombre} y listas '$nombre'
+            
+        Returns:
+            Path: Archivo generado
+        """
+        fig = self.nueva_figura(tuple(escena.get('tamano', (14, 10))))
+        ax = fig.subplots()
+        dibujar_flechas = self.dibujar_escena(ax, escena, contexto)
+        fig.tight_layout()
+        dibujar_flechas()
+        return self.guardar_figura(fig, nombre)
+    
+    def cargar_metricas(self, max_corridas=30):
+        """
+        Lee las métricas de las últimas corridas del extractor
+        
+        Args:
+            max_corridas (int): Máximo de corridas a leer (las más recientes)
+            
+        Returns:
+            list: Resúmenes de MetricasETL ordenados del más antiguo al más reciente
+        """
+        corridas = []
+        for archivo in sorted(self.metricas_dir.glob('metricas_*.json'))[-max_corridas:]:
+            try:
+                with open(archivo, 'r', encoding='utf-8') as f:
+                    corridas.append(json.load(f))
+            except (OSError, json.JSONDecodeError):
+                print(f"⚠️  Métricas ilegibles, se omiten: {archivo}")
+        return sorted(corridas, key=lambda c: c.get('inicio', ''))
+    
+    @staticmethod
+    def _throughput(corrida):
+        """Registros por segundo de una corrida (None si no hay datos)"""
+        registros = corrida.get('contadores', {}).get('ciudades_exitosas')
+        duracion = corrida.get('duracion_s')
+        if not registros or not duracion:
+            return None
+        return registros / duracion
+    
+    def _contenido_metricas(self):
+        """Nombre y contenido de los archivos de métricas que lee diagrama_rendimiento"""
+        return [(archivo.name, archivo.read_text(encoding='utf-8'))
+                for archivo in sorted(self.metricas_dir.glob('metricas_*.json'))[-30:]]
+    
+    def _textos_metricas(self):
+        """
+        Valores medidos en la última corrida para los diagramas de arquitectura
+        
+        Sin métricas no se inventan cifras: los campos remiten a
+        etl_rendimiento.
+        
+        Returns:
+            dict: duracion y volumen (textos) y rendimiento (líneas del panel)
+        """
+        corridas = self.cargar_metricas(max_corridas=1)
+        if not corridas:
+            return {
+                'duracion': 'sin medir (ver etl_rendimiento)',
+                'volumen': 'sin medir (ver etl_rendimiento)',
+                'rendimiento': ['• Sin métricas todavía:', '• ejecuta extractor.py y',
+                                '• consulta etl_rendimiento'],
+            }
+        
+        ultima = corridas[-1]
+        etapas = ultima.get('etapas', {})
+        api = etapas.get('extraer_clima', {}).get('p50_s')
+        transformacion = sum(est['total_s'] for e, est in etapas.items()
+                             if e.startswith(('procesar_respuesta', 'validar_datos'))) * 1000
+        escritura = sum(est['total_s'] for e, est in etapas.items() if e.startswith('guardar_')) * 1000
+        throughput = self._throughput(ultima)
+        registros = ultima.get('contadores', {}).get('ciudades_exitosas', 0)
+        return {
+            'duracion': f"{ultima.get('duracion_s', 0):.1f} s (última corrida)",
+            'volumen': f"{registros:.0f} registros (última corrida)",
+            'rendimiento': [
+                f"• Tiempo API (p50): {api * 1000:.0f}ms" if api is not None else "• Tiempo API: sin datos",
+                f"• Transformación: {transformacion:.1f}ms",
+                f"• Escritura: {escritura:.0f}ms",
+                f"• Total: {ultima.get('duracion_s', 0):.2f} seg",
+                f"• Throughput: {throughput:.1f} rec/seg" if throughput else "• Throughput: sin datos",
+            ],
+        }
+    
+    def diagrama_flujo_principal(self):
+        """Crea el diagrama de flujo principal del ETL"""
+        self.renderizar_escena(self.ESCENAS['diagrama_flujo_principal'], 'etl_flujo_principal',
+                               self._textos_metricas())
+    
+    def diagrama_componentes(self):
+        """Crea un diagrama de componentes del sistema"""
+        self.renderizar_escena(self.ESCENAS['diagrama_componentes'], 'etl_componentes')
     
     def diagrama_flujo_datos(self):
         """Crea un diagrama detallado del flujo de datos"""
-        fig, ax = plt.subplots(1, 1, figsize=(14, 10))
+        self.renderizar_escena(self.ESCENAS['diagrama_flujo_datos'], 'etl_flujo_datos',
+                               self._textos_metricas())
+    
+    def diagrama_rendimiento(self, max_corridas=30, max_ciudades=15):
+        """
+        Crea el diagrama de rendimiento a partir de las métricas reales
         
-        ax.set_xlim(-0.5, 10)
-        ax.set_ylim(-0.5, 10)
-        ax.axis('off')
+        Paneles: duración por etapa de la última corrida, throughput por
+        corrida, latencia de extraer_clima por ciudad y p50/p95 de las
+        solicitudes HTTP por corrida.
         
-        # Título
-        ax.text(5, 9.5, 'FLUJO DE DATOS DETALLADO',
-               fontsize=16, fontweight='bold', ha='center')
-        
-        # Etapa 1: API Response
-        ax.text(1.5, 8.8, 'ETAPA 1: API Response', fontsize=9, fontweight='bold')
-        ax.text(1.5, 8.3, 'Formato JSON:\n{',
-               fontsize=8, family='monospace',
-               bbox=dict(boxstyle='round', facecolor='#FFE66D', alpha=0.7))
-        ax.text(1.5, 7.6, '"current": {...},\n"location": {...}', fontsize=7,
-               family='monospace')
-        
-        # Flecha
-        self.dibujar_flecha(ax, 2, 7.2, 5, 6.8)
-        
-        # Etapa 2: Extracción
-        ax.text(5.5, 8.8, 'ETAPA 2: Extracción', fontsize=9, fontweight='bold')
-        ax.text(5.5, 8.3, 'Campos relevantes:\n- temperatura\n- humedad\n- ciudad\n- timestamp',
-               fontsize=8)
-        
-        # Flecha
-        self.dibujar_flecha(ax, 5, 7.2, 8, 6.8)
-        
-        # Etapa 3: Normalización
-        ax.text(8.5, 8.8, 'ETAPA 3: Normalizado', fontsize=9, fontweight='bold')
-        ax.text(8.5, 8.3, 'Tipos consistentes:\n- Números\n- Strings\n- Timestamps',
-               fontsize=8)
-        
-        # Salida CSV
-        ax.text(1, 5.5, 'CSV (Tabular)', fontsize=10, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.8))
-        ax.text(1, 5, 'ciudad,temp,humedad\nBogota,22,65\nMedellin,24,70',
-               fontsize=7, family='monospace',
-               bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-        
-        # Salida JSON
-        ax.text(5, 5.5, 'JSON (Estructurado)', fontsize=10, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.8))
-        ax.text(5, 5, '[{\n  "ciudad":"Bogota",\n  "temp":22\n}]',
-               fontsize=7, family='monospace',
-               bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-        
-        # Salida PNG
-        ax.text(9, 5.5, 'PNG (Visualizado)', fontsize=10, fontweight='bold',
-               bbox=dict(boxstyle='round', facecolor=self.color_data, alpha=0.8))
-        ax.text(8.3, 4.7, '📊\n[Gráficos]', fontsize=9,
-               bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-        
-        # Flechas hacia salidas
-        self.dibujar_flecha(ax, 5, 6.2, 1, 5.9)
-        self.dibujar_flecha(ax, 5, 6.2, 5, 5.9)
-        self.dibujar_flecha(ax, 5, 6.2, 9, 5.9)
-        
-        # Estadísticas
-        stats_y = 3
-        ax.text(2, stats_y + 1, '📊 ESTADÍSTICAS', fontsize=10, fontweight='bold')
-        stats = [
-            '• Ciudades: 5',
-            '• Campos por ciudad: 10',
-            '• Registros por ejecución: ~5',
-            '• Tamaño CSV: ~2-5 KB',
-            '• Tamaño JSON: ~3-8 KB',
-        ]
-        for i, stat in enumerate(stats):
-            ax.text(2, stats_y - i*0.35, stat, fontsize=8)
-        
-        # Quality Checks
-        ax.text(5.5, stats_y + 1, '✅ CALIDAD DE DATOS', fontsize=10, fontweight='bold')
-        checks = [
-            '✓ Sin valores nulos',
-            '✓ Tipos consistentes',
-            '✓ Rangos válidos',
-            '✓ Timestamps consistentes',
-            '✓ Duplicados detectados',
-        ]
-        for i, check in enumerate(checks):
-            ax.text(5.5, stats_y - i*0.35, check, fontsize=8, color='#27AE60')
-        
-        # Performance
-        ax.text(8, stats_y + 1, '⚡ PERFORMANCE', fontsize=10, fontweight='bold')
-        perf = [
-            '• Tiempo API: ~800ms',
-            '• Transformación: ~50ms',
-            '• Escritura: ~100ms',
-            '• Total: ~2-3 seg',
-            '• Throughput: ~2.5 rec/seg',
-        ]
-        for i, p in enumerate(perf):
-            ax.text(8, stats_y - i*0.35, p, fontsize=8)
-        
-        # Footer
-        ax.text(5, 0.2, '🔄 Este flujo se repite cada ejecución del script extractor.py',
-               fontsize=9, style='italic', ha='center')
-        
-        plt.tight_layout()
-        output_file = self.output_dir / 'etl_flujo_datos.png'
-        plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✅ Diagrama guardado: {output_file}")
-        plt.close()
+        Args:
+            max_corridas (int): Corridas recientes a considerar
+            max_ciudades (int): Ciudades a mostrar (las de mayor latencia mediana)
+            
+        Returns:
+            bool: False si no hay métricas para graficar
+        """
+        corridas = self.cargar_metricas(max_corridas)
+        if not corridas:
+            print(f"⚠️  Sin métricas en {self.metricas_dir}, se omite el diagrama de rendimiento")
+            return False
+        ultima = corridas[-1]
+        
+        fig = self.nueva_figura((14, 10))
+        axes = fig.subplots(2, 2)
+        fig.suptitle('RENDIMIENTO MEDIDO DEL PIPELINE ETL', fontsize=16, fontweight='bold')
+        
+        # 1. Duración por etapa (última corrida)
+        ax = axes[0, 0]
+        etapas = sorted(ultima.get('etapas', {}).items(), key=lambda e: e[1]['total_s'])
+        nombres = [nombre for nombre, _ in etapas]
+        totales = [est['total_s'] * 1000 for _, est in etapas]
+        ax.barh(nombres, totales, color=self.color_transform, edgecolor='black')
+        for i, (_, est) in enumerate(etapas):
+            ax.text(totales[i], i, f"  n={est['cantidad']} p50={est['p50_s'] * 1000:.1f}ms "
+                                   f"p95={est['p95_s'] * 1000:.1f}ms",
+                    va='center', fontsize=7)
+        ax.set_xlabel('Tiempo acumulado (ms)')
+        ax.set_title(f"Duración por etapa ({ultima.get('inicio', '')[:19]})", fontsize=10)
+        ax.margins(x=0.6)
+        
+        # 2. Throughput por corrida
+        ax = axes[0, 1]
+        puntos = [(datetime.fromisoformat(c['inicio']), self._throughput(c))
+                  for c in corridas if c.get('inicio') and self._throughput(c)]
+        if puntos:
+            fechas, valores = zip(*puntos)
+            ax.plot(fechas, valores, marker='o', color=self.color_extract)
+            ax.axhline(np.median(valores), linestyle='--', color='#555',
+                       label=f'mediana {np.median(valores):.1f} rec/s')
+            ax.legend(fontsize=8)
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+            ax.tick_params(axis='x', rotation=30, labelsize=7)
+        ax.set_ylabel('Registros / segundo')
+        ax.set_title(f'Throughput por corrida ({len(corridas)} corridas)', fontsize=10)
+        ax.grid(alpha=0.3)
+        
+        # 3. Latencia de extraer_clima por ciudad (todas las corridas)
+        ax = axes[1, 0]
+        por_ciudad = {}
+        for corrida in corridas:
+            for ciudad, latencias in corrida.get('ciudades', {}).items():
+                por_ciudad.setdefault(ciudad, []).extend(v * 1000 for v in latencias)
+        ciudades = sorted(por_ciudad, key=lambda c: np.median(por_ciudad[c]), reverse=True)[:max_ciudades]
+        if ciudades:
+            ax.boxplot([por_ciudad[c] for c in ciudades], vert=False,
+                       patch_artist=True, boxprops=dict(facecolor=self.color_api))
+            # Etiquetas por eje: el parámetro labels de boxplot está obsoleto
+            ax.set_yticks(range(1, len(ciudades) + 1))
+            ax.set_yticklabels(ciudades)
+        ax.set_xlabel('Latencia extraer_clima (ms)')
+        ax.set_title('Latencia por ciudad', fontsize=10)
+        ax.tick_params(axis='y', labelsize=7)
+        
+        # 4. Latencia HTTP p50/p95 por corrida
+        ax = axes[1, 1]
+        http = [(i, c['etapas']['solicitud_http']) for i, c in enumerate(corridas)
+                if 'solicitud_http' in c.get('etapas', {})]
+        if http:
+            indices = [i + 1 for i, _ in http]
+            ax.plot(indices, [e['p50_s'] * 1000 for _, e in http], marker='o', label='p50')
+            ax.plot(indices, [e['p95_s'] * 1000 for _, e in http], marker='s', label='p95')
+            ax.plot(indices, [e['p99_s'] * 1000 for _, e in http], marker='^', label='p99', alpha=0.6)
+            ax.legend(fontsize=8)
+        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.set_xlabel('Corrida')
+        ax.set_ylabel('ms')
+        ax.set_title('Latencia de solicitudes HTTP', fontsize=10)
+        ax.grid(alpha=0.3)
+        
+        fig.tight_layout()
+        self.guardar_figura(fig, 'etl_rendimiento')
+        return True
     
-    def generar_todos_diagramas(self):
-        """Genera todos los diagramas"""
-        print("\n" + "="*60)
-        print("GENERANDO DIAGRAMAS DEL PIPELINE ETL")
-        print("="*60)
+    def huella(self, metodo):
+        """
+        Huella SHA-256 de todo lo que determina la imagen de un diagrama
+        
+        Incluye el código del método y de los métodos auxiliares, su escena
+        declarativa (textos y posiciones), los colores y el estilo de las
+        escenas, el formato y dpi, la versión de matplotlib y los datos que
+        dibuja según DATOS_DIAGRAMA.
+        
+        Sin el código fuente (despliegue solo con .pyc) no hay huella y el
+        diagrama se vuelve a renderizar siempre.
+        
+        Args:
+            metodo (str): Nombre del método del diagrama
+            
+        Returns:
+            str: Huella hexadecimal, o None si no se puede calcular
+        """
+        h = hashlib.sha256()
+        for nombre in (metodo,) + self.AUXILIARES:
+            try:
+                fuente = inspect.getsource(getattr(type(self), nombre))
+            except (OSError, TypeError):
+                return None
+            h.update(fuente.encode('utf-8'))
+        colores = {k: v for k, v in sorted(vars(self).items()) if k.startswith('color_')}
+        estilo = [self.PAD_CAJA, self.PUNTA_LARGO, self.PUNTA_ANCHO, self.RECORTE_FLECHA]
+        h.update(json.dumps([colores, estilo, self.formato, self.dpi, matplotlib.__version__,
+                             self.ESCENAS.get(metodo)], ensure_ascii=False).encode('utf-8'))
+        if metodo in self.DATOS_DIAGRAMA:
+            datos = getattr(self, self.DATOS_DIAGRAMA[metodo])()
+            h.update(json.dumps(datos, ensure_ascii=False).encode('utf-8'))
+        return h.hexdigest()
+    
+    def _leer_cache(self):
+        try:
+            with open(self.archivo_cache, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def _guardar_cache(self, cache):
+        temporal = self.archivo_cache.with_suffix('.tmp')
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temporal, self.archivo_cache)
+    
+    def generar_todos_diagramas(self, procesos=None, forzar=False, perfil=None, dpi=None):
+        """
+        Genera todos los diagramas de DIAGRAMAS
+        
+        Cada diagrama se renderiza en su propio proceso; las figuras no
+        comparten estado, así que el tiempo total se acerca al del diagrama
+        más lento en lugar de la suma de todos.
+        
+        Los diagramas cuya huella coincide con la del último render (y cuyo
+        archivo sigue existiendo) no se vuelven a generar.
         
-        print("\n1️⃣  Generando diagrama de flujo principal...")
-        self.diagrama_flujo_principal()
+        Args:
+            procesos (int): Procesos a usar (por defecto uno por diagrama
+                pendiente, hasta os.cpu_count(); 1 = secuencial en este proceso)
+            forzar (bool): Regenerar todos aunque no hayan cambiado
+            perfil (str): Perfil de salida para esta llamada (por defecto el
+                del generador): png, preview, svg, pdf o webp
+            dpi (int): Resolución para esta llamada (por defecto la del perfil)
+            
+        Returns:
+            dict: segundos (tiempo de la etapa), bytes (tamaño total de los
+                archivos) y renderizados (diagramas que se regeneraron)
+        """
+        config = self._config()
+        if perfil:
+            config.update(perfil=perfil, dpi=dpi)
+        elif dpi:
+            config.update(dpi=dpi)
+        generador = DiagramaETL(**config)
+        config = generador._config()
         
-        print("\n2️⃣  Generando diagrama de componentes...")
-        self.diagrama_componentes()
+        print("\n" + "="*60)
+        print(f"GENERANDO DIAGRAMAS DEL PIPELINE ETL "
+              f"({generador.formato.upper()}, {generador.dpi} dpi)")
+        print("="*60)
         
-        print("\n3️⃣  Generando diagrama de flujo de datos...")
-        self.diagrama_flujo_datos()
+        inicio = time.perf_counter()
+        cache = generador._leer_cache()
+        archivos = {metodo: generador.archivo(nombre) for metodo, nombre, _ in self.DIAGRAMAS}
+        huellas = {metodo: generador.huella(metodo) for metodo, _, _ in self.DIAGRAMAS}
+        pendientes = [metodo for metodo, _, _ in self.DIAGRAMAS
+                      if forzar or huellas[metodo] is None
+                      or cache.get(archivos[metodo].name) != huellas[metodo]
+                      or not archivos[metodo].exists()]
+        
+        procesos = procesos or min(len(pendientes), os.cpu_count() or 1)
+        if not pendientes:
+            resultados = []
+        elif procesos <= 1:
+            resultados = [_renderizar(config, metodo) for metodo in pendientes]
+        else:
+            # spawn: procesos limpios, sin heredar hilos ni locks del llamador
+            contexto = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as executor:
+                resultados = list(executor.map(_renderizar, [config] * len(pendientes), pendientes))
+        total = time.perf_counter() - inicio
+        
+        # Solo cuentan los diagramas que escribieron su archivo (p. ej.
+        # diagrama_rendimiento se omite si todavía no hay métricas)
+        segundos = {metodo: t for metodo, (t, escrito) in zip(pendientes, resultados) if escrito}
+        omitidos = [metodo for metodo in pendientes if metodo not in segundos]
+        # Solo se anota la huella de lo que se acaba de escribir: un archivo
+        # viejo de un diagrama omitido no queda como vigente
+        for metodo in pendientes:
+            nombre = archivos[metodo].name
+            if metodo in segundos and huellas[metodo] is not None:
+                cache[nombre] = huellas[metodo]
+            else:
+                cache.pop(nombre, None)
+        generador._guardar_cache(cache)
         
         print("\n" + "="*60)
-        print("✅ TODOS LOS DIAGRAMAS GENERADOS EXITOSAMENTE")
+        if omitidos:
+            print(f"⚠️  DIAGRAMAS GENERADOS ({len(omitidos)} omitidos: {', '.join(omitidos)})")
+        else:
+            print("✅ TODOS LOS DIAGRAMAS GENERADOS EXITOSAMENTE")
         print("="*60)
         print(f"\n📁 Ubicación: {self.output_dir.absolute()}/")
         print("\nArchivos generados:")
-        print("  • etl_flujo_principal.png - Flujo general del ETL")
-        print("  • etl_componentes.png - Componentes del sistema")
-        print("  • etl_flujo_datos.png - Transformación de datos")
+        tamano_total = 0
+        for metodo, _, descripcion in self.DIAGRAMAS:
+            archivo = archivos[metodo]
+            if not archivo.exists():
+                continue
+            tamano_total += archivo.stat().st_size
+            estado = f"{segundos[metodo]:.2f}s" if metodo in segundos else "sin cambios, en caché"
+            print(f"  • {archivo.name} - {descripcion} "
+                  f"({estado}, {archivo.stat().st_size / 1024:.0f} KB)")
+        print(f"\n⏱️  Etapa de diagramas: {total:.2f}s, {tamano_total / 1024:.0f} KB "
+              f"({len(segundos)}/{len(self.DIAGRAMAS)} renderizados"
+              f"{f', {procesos} procesos' if len(pendientes) > 1 and procesos > 1 else ''})")
+        return {'segundos': total, 'bytes': tamano_total, 'renderizados': len(segundos)}
+    
+    def comparar_perfiles(self, perfiles=None, procesos=None):
+        """
+        Renderiza los diagramas con varios perfiles y compara tiempo y tamaño
+        
+        Args:
+            perfiles (list): Perfiles a comparar (por defecto todos los de PERFILES)
+            procesos (int): Procesos por perfil (ver generar_todos_diagramas)
+            
+        Returns:
+            dict: Resultado de generar_todos_diagramas por perfil
+        """
+        resultados = {}
+        for perfil in perfiles or list(self.PERFILES):
+            resultados[perfil] = self.generar_todos_diagramas(procesos=procesos, forzar=True,
+                                                              perfil=perfil)
+        
+        base = resultados.get('png') or next(iter(resultados.values()))
+        print("\n" + "="*60)
+        print("COMPARACIÓN DE PERFILES DE SALIDA")
+        print("="*60)
+        print(f"{'Perfil':<10} {'Formato':<8} {'DPI':>5} {'Tiempo':>9} {'Tamaño':>11} {'vs png':>8}")
+        for perfil, r in resultados.items():
+            formato, dpi, _ = self.PERFILES[perfil]
+            relativo = r['bytes'] / base['bytes'] if base['bytes'] else 0
+            print(f"{perfil:<10} {formato:<8} {dpi:>5} {r['segundos']:>8.2f}s "
+                  f"{r['bytes'] / 1024:>8.0f} KB {relativo:>7.0%}")
+        return resultados
+    
+    def _config(self):
+        """Argumentos para reconstruir este generador en otro proceso"""
+        return {'output_dir': str(self.output_dir), 'metricas_dir': str(self.metricas_dir),
+                'perfil': self.perfil, 'dpi': self.dpi}
+
+
+def _renderizar(config, metodo):
+    """
+    Renderiza un diagrama en el proceso actual (función de nivel de módulo
+    para que ProcessPoolExecutor la pueda enviar a los workers)
+    
+    Returns:
+        tuple: (segundos que tomó el render, False si el diagrama se omitió
+            sin escribir su archivo)
+    """
+    inicio = time.perf_counter()
+    escrito = getattr(DiagramaETL(**config), metodo)() is not False
+    return time.perf_counter() - inicio, escrito
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Genera los diagramas del pipeline ETL')
+    parser.add_argument('--perfil', choices=list(DiagramaETL.PERFILES), default='png',
+                        help='Formato de salida (por defecto png a 300 dpi)')
+    parser.add_argument('--dpi', type=int, help='Resolución (por defecto la del perfil)')
+    parser.add_argument('--forzar', action='store_true', help='Ignorar la caché de render')
+    parser.add_argument('--comparar', action='store_true',
+                        help='Renderizar con todos los perfiles y comparar tiempo y tamaño')
+    parser.add_argument('--escena', metavar='ARCHIVO',
+                        help='Renderizar solo una escena declarativa (.json o .yaml)')
+    args = parser.parse_args()
+    
     # Ejecutable directo
-    generador = DiagramaETL(output_dir='data')
-    generador.generar_todos_diagramas()
+    generador = DiagramaETL(output_dir='data', perfil=args.perfil, dpi=args.dpi)
+    if args.escena:
+        generador.renderizar_escena(DiagramaETL.cargar_escena(args.escena), Path(args.escena).stem)
+    elif args.comparar:
+        generador.comparar_perfiles()
+    else:
+        generador.generar_todos_diagramas(forzar=args.forzar, perfil=args.perfil, dpi=args.dpi)
     
     print("\n💡 Para usar en tu proyecto:")
     print("   from etl_diagram import DiagramaETL")
     print("   diagrama = DiagramaETL()")
-    print("   diagrama.generar_todos_diagramas()")
+    print("   diagrama.generar_todos_diagramas(perfil='svg')")
@@ -0,0 +1,74 @@
+"""
+Pruebas del upsert de CargadorBD sobre SQLite
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extractor  # noqa: E402
+from extractor import CargadorBD  # noqa: E402
+
+
+def registro(ciudad, fecha, temperatura=20.0):
+    datos = dict.fromkeys(extractor.ESQUEMA_CLIMA)
+    datos.update(ciudad=ciudad, temperatura_c=temperatura, humedad=60, fecha_observacion=fecha)
+    return datos
+
+
+@pytest.fixture
+def cargador(tmp_path):
+    cargador = CargadorBD(f"sqlite:///{tmp_path / 'clima.db'}")
+    yield cargador
+    cargador.cerrar()
+
+
+def filas(cargador):
+    with cargador.conexion() as conn:
+        return conn.execute(
+            "SELECT ciudad, fecha_observacion, temperatura_c FROM clima ORDER BY ciudad, fecha_observacion"
+        ).fetchall()
+
+
+def test_recargar_es_idempotente(cargador):
+    datos = [registro('Bogota', '2026-10-01 15:00'), registro('Cali', '2026-10-01 15:00')]
+
+    cargador.cargar(datos)
+    antes = filas(cargador)
+    cargador.cargar(datos)
+
+    assert filas(cargador) == antes
+    assert cargador.contar() == 2
+
+
+def test_upsert_actualiza_la_observacion(cargador):
+    cargador.cargar([registro('Bogota', '2026-10-01 15:00', 14.0)])
+    cargador.cargar([registro('Bogota', '2026-10-01 15:00', 15.5),
+                     registro('Bogota', '2026-10-01 18:00', 13.0)])
+
+    assert filas(cargador) == [('Bogota', '2026-10-01 15:00', 15.5),
+                               ('Bogota', '2026-10-01 18:00', 13.0)]
+
+
+def test_clave_repetida_en_el_lote_queda_la_ultima(cargador):
+    enviadas = cargador.cargar([registro('Bogota', '2026-10-01 15:00', 14.0),
+                                registro('Bogota', '2026-10-01 15:00', 16.0),
+                                registro('Cali', None), registro('Cali', None)],
+                               tamano_lote=10)
+
+    # Las filas sin fecha de observación no chocan con la clave única
+    assert enviadas == 3
+    assert filas(cargador) == [('Bogota', '2026-10-01 15:00', 16.0),
+                               ('Cali', None, 20.0), ('Cali', None, 20.0)]
+
+
+def test_acepta_dataframe(cargador):
+    df = extractor.WeatherstackExtractor.a_dataframe([registro('Bogota', '2026-10-01 15:00')])
+
+    assert cargador.cargar(df) == 1
+    assert filas(cargador) == [('Bogota', '2026-10-01 15:00', 20.0)]
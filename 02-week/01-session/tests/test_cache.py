@@ -0,0 +1,73 @@
+"""
+Pruebas de la caché persistente de respuestas (CacheSQLite)
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extractor  # noqa: E402
+from extractor import CacheSQLite  # noqa: E402
+
+
+class Reloj:
+    """Reemplazo de time.time que avanza solo cuando la prueba lo pide"""
+
+    def __init__(self, ahora=1_000_000.0):
+        self.ahora = ahora
+
+    def __call__(self):
+        return self.ahora
+
+
+def test_respuesta_expira_tras_el_ttl(tmp_path, monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(extractor.time, 'time', reloj)
+    cache = CacheSQLite(str(tmp_path / 'cache.sqlite'), ttl=60)
+
+    cache.guardar('Bogota ', {'current': {'temperature': 14}})
+    reloj.ahora += 59
+    assert cache.obtener('bogota') == {'current': {'temperature': 14}}
+    reloj.ahora += 2
+    assert cache.obtener('bogota') is None
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+    cache.cerrar()
+
+
+def test_sobrevive_entre_instancias(tmp_path):
+    archivo = str(tmp_path / 'cache.sqlite')
+    cache = CacheSQLite(archivo, ttl=600)
+    cache.guardar('Cali', {'current': {'temperature': 0}})
+    cache.cerrar()
+
+    cache = CacheSQLite(archivo, ttl=600)
+    assert cache.obtener('Cali') == {'current': {'temperature': 0}}
+    cache.cerrar()
+
+
+def test_expulsa_expiradas_y_luego_las_de_acceso_mas_antiguo(tmp_path, monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(extractor.time, 'time', reloj)
+    cache = CacheSQLite(str(tmp_path / 'cache.sqlite'), ttl=100, max_entradas=2)
+
+    def claves():
+        return [fila[0] for fila in cache._conn.execute("SELECT clave FROM respuestas ORDER BY clave")]
+
+    cache.guardar('vieja', {'n': 0})
+    reloj.ahora += 150
+    cache.guardar('a', {'n': 1})
+    reloj.ahora += 1
+    # Al superar el límite primero sale la expirada
+    cache.guardar('b', {'n': 2})
+    assert claves() == ['a', 'b']
+
+    reloj.ahora += 1
+    assert cache.obtener('a') == {'n': 1}
+    reloj.ahora += 1
+    # Sin expiradas, sale la de acceso más antiguo (b; a se acaba de leer)
+    cache.guardar('c', {'n': 3})
+    assert claves() == ['a', 'c']
+    cache.cerrar()
@@ -0,0 +1,116 @@
+"""
+Pruebas de regresión de la deduplicación en cargas incrementales
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import csv
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extractor  # noqa: E402
+from extractor import IndiceDedup, SumideroCSV, SumideroNDJSON, leer_ndjson  # noqa: E402
+
+
+def registro(ciudad, fecha, temperatura=20.0):
+    """Registro mínimo con las columnas de ESQUEMA_CLIMA"""
+    datos = dict.fromkeys(extractor.ESQUEMA_CLIMA)
+    datos.update(ciudad=ciudad, pais='Colombia', temperatura_c=temperatura,
+                 humedad=60, fecha_observacion=fecha)
+    return datos
+
+
+def leer_csv(archivo):
+    with open(archivo, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_csv_sin_indice_se_deduplica_al_agregar(tmp_path):
+    archivo = str(tmp_path / 'clima.csv')
+    # Archivo de una corrida anterior, sin <archivo>.claves.json
+    sumidero = SumideroCSV(archivo)
+    sumidero.escribir([registro('Bogota', '2026-10-01 15:00'), registro('Cali', '2026-10-01 15:00')])
+    sumidero.cerrar()
+    assert not os.path.exists(archivo + '.claves.json')
+
+    sumidero = SumideroCSV(archivo, agregar=True, deduplicar=True)
+    sumidero.escribir([registro('Bogota', '2026-10-01 15:00'), registro('Bogota', '2026-10-01 18:00')])
+    sumidero.escribir([registro('Cali', '2026-10-01 15:00'), registro('Bogota', '2026-10-01 18:00')])
+    sumidero.cerrar()
+
+    filas = [(f['ciudad'], f['fecha_observacion']) for f in leer_csv(archivo)]
+    assert filas == [('Bogota', '2026-10-01 15:00'), ('Cali', '2026-10-01 15:00'),
+                     ('Bogota', '2026-10-01 18:00')]
+    assert sumidero.omitidos == 3
+    with open(archivo + '.claves.json', 'r', encoding='utf-8') as f:
+        assert json.load(f) == {'Bogota': '2026-10-01 18:00', 'Cali': '2026-10-01 15:00'}
+
+
+def test_ndjson_en_streaming_deduplica_entre_corridas(tmp_path):
+    archivo = str(tmp_path / 'clima.ndjson')
+    for _ in range(2):
+        sumidero = SumideroNDJSON(archivo, agregar=True, deduplicar=True)
+        sumidero.escribir([registro('Bogota', '2026-10-01 15:00'), registro('Cali', None)])
+        sumidero.cerrar()
+
+    registros = list(leer_ndjson(archivo))
+    # Las filas sin fecha de observación siempre se conservan
+    assert [(r['ciudad'], r['fecha_observacion']) for r in registros] == [
+        ('Bogota', '2026-10-01 15:00'), ('Cali', None), ('Cali', None)]
+
+
+def test_indice_se_reconstruye_desde_ndjson(tmp_path):
+    archivo = str(tmp_path / 'clima.ndjson')
+    with extractor.EscritorNDJSON(archivo) as escritor:
+        escritor.escribir_todos([registro('Bogota', '2026-10-01 18:00'),
+                                 registro('Bogota', '2026-10-01 15:00')])
+
+    indice = IndiceDedup(archivo)
+    assert indice.ultimas == {'Bogota': '2026-10-01 18:00'}
+    assert indice.filtrar([registro('Bogota', '2026-10-01 15:00')]) == []
+
+
+def test_guardar_csv_incremental_sin_indice(tmp_path):
+    archivo = str(tmp_path / 'clima.csv')
+    datos = [registro('Bogota', '2026-10-01 15:00'), registro('Cali', '2026-10-01 15:00')]
+    etl = extractor.WeatherstackExtractor.__new__(extractor.WeatherstackExtractor)
+    etl.metricas = extractor.MetricasETL()
+
+    assert etl.guardar_csv(datos, archivo)
+    assert etl.guardar_csv(datos + [registro('Cali', '2026-10-01 18:00')], archivo,
+                           incremental=True, deduplicar=True)
+
+    filas = [(f['ciudad'], f['fecha_observacion']) for f in leer_csv(archivo)]
+    assert filas == [('Bogota', '2026-10-01 15:00'), ('Cali', '2026-10-01 15:00'),
+                     ('Cali', '2026-10-01 18:00')]
+
+
+def test_indice_danado_se_reconstruye(tmp_path):
+    archivo = str(tmp_path / 'clima.ndjson')
+    with extractor.EscritorNDJSON(archivo) as escritor:
+        escritor.escribir_todos([registro('Bogota', '2026-10-01 15:00')])
+    with open(archivo + '.claves.json', 'w', encoding='utf-8') as f:
+        f.write('{"Bogota": "2026-10')
+
+    assert IndiceDedup(archivo).ultimas == {'Bogota': '2026-10-01 15:00'}
+
+
+def test_sobrescribir_descarta_el_indice(tmp_path):
+    archivo = str(tmp_path / 'clima.csv')
+    etl = extractor.WeatherstackExtractor.__new__(extractor.WeatherstackExtractor)
+    etl.metricas = extractor.MetricasETL()
+
+    assert etl.guardar_csv([registro('Bogota', '2026-10-01 18:00')], archivo,
+                           incremental=True, deduplicar=True)
+    assert os.path.exists(archivo + '.claves.json')
+    # Una carga completa reemplaza el historial: el índice viejo ya no vale
+    assert etl.guardar_csv([registro('Bogota', '2026-10-01 15:00')], archivo)
+    assert not os.path.exists(archivo + '.claves.json')
+
+    assert etl.guardar_csv([registro('Bogota', '2026-10-01 18:00')], archivo,
+                           incremental=True, deduplicar=True)
+    filas = [(f['ciudad'], f['fecha_observacion']) for f in leer_csv(archivo)]
+    assert filas == [('Bogota', '2026-10-01 15:00'), ('Bogota', '2026-10-01 18:00')]
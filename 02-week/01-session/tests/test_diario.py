@@ -0,0 +1,91 @@
+"""
+Pruebas del diario de ejecución y la reanudación con --resume
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import DiarioEjecucion, WeatherstackExtractor  # noqa: E402
+
+CIUDADES = ['Bogota', 'Medellin', 'Cali', 'Barranquilla', 'Cartagena']
+
+
+def respuesta(ciudad):
+    return {'location': {'name': ciudad, 'country': 'Colombia'},
+            'current': {'temperature': 20, 'humidity': 60}}
+
+
+@pytest.fixture
+def crear_etl(monkeypatch):
+    monkeypatch.setenv('API_KEY', 'prueba')
+    monkeypatch.setenv('CACHE_BACKEND', 'ninguna')
+    monkeypatch.setenv('CIUDADES', ','.join(CIUDADES))
+    creados = []
+
+    def crear(fallan=(), max_workers=1):
+        etl = WeatherstackExtractor(max_workers=max_workers)
+        etl.consultadas = []
+
+        def extraer_clima(ciudad):
+            etl.consultadas.append(ciudad)
+            return None if ciudad in fallan else respuesta(ciudad)
+        etl.extraer_clima = extraer_clima
+        creados.append(etl)
+        return etl
+
+    yield crear
+    for etl in creados:
+        etl.cerrar()
+
+
+def test_reanudar_conserva_el_orden_de_las_ciudades(tmp_path, crear_etl):
+    archivo = str(tmp_path / 'diario.ndjson')
+    with DiarioEjecucion(archivo) as diario:
+        datos = crear_etl(fallan={'Medellin', 'Barranquilla'}).ejecutar_extraccion(diario=diario)
+    assert [d['ciudad'] for d in datos] == ['Bogota', 'Cali', 'Cartagena']
+
+    etl = crear_etl(max_workers=3)
+    with DiarioEjecucion(archivo, reanudar=True) as diario:
+        datos = etl.ejecutar_extraccion(diario=diario)
+
+    # Solo se consultan las fallidas y el resultado sigue el orden de CIUDADES
+    assert sorted(etl.consultadas) == ['Barranquilla', 'Medellin']
+    assert [d['ciudad'] for d in datos] == CIUDADES
+
+
+def test_sin_reanudar_empieza_un_diario_nuevo(tmp_path, crear_etl):
+    archivo = str(tmp_path / 'diario.ndjson')
+    with DiarioEjecucion(archivo) as diario:
+        crear_etl().ejecutar_extraccion(diario=diario)
+
+    etl = crear_etl()
+    with DiarioEjecucion(archivo) as diario:
+        assert diario.completadas() == {}
+        etl.ejecutar_extraccion(diario=diario)
+    assert etl.consultadas == CIUDADES
+
+
+def test_linea_truncada_se_ignora(tmp_path):
+    archivo = tmp_path / 'diario.ndjson'
+    with DiarioEjecucion(str(archivo)) as diario:
+        diario.registrar('Bogota', {'ciudad': 'Bogota'})
+    with open(archivo, 'a', encoding='utf-8') as f:
+        f.write('{"ciudad": "Cali", "dat')
+
+    with DiarioEjecucion(str(archivo), reanudar=True) as diario:
+        assert list(diario.completadas()) == ['Bogota']
+
+
+def test_finalizar_elimina_el_diario(tmp_path):
+    archivo = tmp_path / 'diario.ndjson'
+    diario = DiarioEjecucion(str(archivo))
+    diario.registrar('Bogota', {'ciudad': 'Bogota'})
+    diario.finalizar()
+
+    assert not archivo.exists()
@@ -0,0 +1,75 @@
+"""
+Pruebas del presupuesto mensual y la persistencia de LimitadorTasa
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import LimitadorTasa  # noqa: E402
+
+
+def leer_uso(archivo):
+    with open(archivo, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_se_detiene_al_agotar_el_presupuesto(tmp_path):
+    limitador = LimitadorTasa(presupuesto_mensual=3, archivo_uso=str(tmp_path / 'uso.json'))
+
+    assert [limitador.adquirir() for _ in range(3)] == [True, True, True]
+    assert not limitador.adquirir()
+    assert limitador.agotado
+    assert limitador.usadas_mes == 3
+
+
+def test_lote_que_no_alcanza_no_consume(tmp_path):
+    limitador = LimitadorTasa(presupuesto_mensual=5, archivo_uso=str(tmp_path / 'uso.json'))
+
+    assert limitador.adquirir(consultas=4)
+    # Una solicitud bulk de 3 ciudades no entra, pero todavía queda una consulta
+    assert not limitador.adquirir(consultas=3)
+    assert not limitador.agotado
+    assert limitador.adquirir()
+    assert limitador.usadas_mes == 5
+
+
+def test_el_contador_persiste_entre_ejecuciones(tmp_path):
+    archivo = str(tmp_path / 'uso.json')
+    limitador = LimitadorTasa(presupuesto_mensual=10, archivo_uso=archivo, guardar_cada=4)
+    for _ in range(5):
+        limitador.adquirir()
+    # Cada 4 solicitudes se escribe; el resto queda pendiente hasta guardar()
+    assert leer_uso(archivo)['solicitudes'] == 4
+    limitador.guardar()
+    assert leer_uso(archivo) == {'mes': datetime.now().strftime('%Y-%m'), 'solicitudes': 5}
+
+    siguiente = LimitadorTasa(presupuesto_mensual=10, archivo_uso=archivo)
+    assert siguiente.usadas_mes == 5
+    assert [siguiente.adquirir() for _ in range(6)] == [True] * 5 + [False]
+
+
+def test_contador_de_otro_mes_se_ignora(tmp_path):
+    archivo = tmp_path / 'uso.json'
+    archivo.write_text(json.dumps({'mes': '2000-01', 'solicitudes': 250}), encoding='utf-8')
+
+    assert LimitadorTasa(presupuesto_mensual=250, archivo_uso=str(archivo)).usadas_mes == 0
+
+
+def test_varios_limitadores_suman_en_el_mismo_archivo(tmp_path):
+    archivo = str(tmp_path / 'uso.json')
+    primero = LimitadorTasa(presupuesto_mensual=100, archivo_uso=archivo, guardar_cada=3)
+    segundo = LimitadorTasa(presupuesto_mensual=100, archivo_uso=archivo, guardar_cada=3)
+    for _ in range(5):
+        primero.adquirir()
+    for _ in range(7):
+        segundo.adquirir()
+    primero.guardar()
+    segundo.guardar()
+
+    assert leer_uso(archivo)['solicitudes'] == 12
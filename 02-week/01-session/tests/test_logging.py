@@ -0,0 +1,48 @@
+"""
+Pruebas del logging en cola con formato JSON
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import EncoladorLogs, FormateadorJSON  # noqa: E402
+
+
+def test_excepcion_en_cola_queda_en_su_propio_campo():
+    cola = queue.SimpleQueue()
+    log = logging.getLogger('pruebas.cola')
+    log.propagate = False
+    log.addHandler(EncoladorLogs(cola))
+    try:
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            log.exception("❌ Error procesando %s", 'Bogota')
+    finally:
+        log.handlers.clear()
+
+    datos = json.loads(FormateadorJSON().format(cola.get_nowait()))
+    assert datos['mensaje'] == '❌ Error procesando Bogota'
+    assert datos['excepcion'].startswith('Traceback')
+    assert 'ZeroDivisionError' in datos['excepcion']
+
+
+def test_texto_conserva_el_traceback():
+    cola = queue.SimpleQueue()
+    registro = logging.LogRecord('pruebas', logging.ERROR, __file__, 1, 'falló %s', ('Cali',), None)
+    try:
+        raise ValueError('sin datos')
+    except ValueError:
+        registro.exc_info = sys.exc_info()
+    EncoladorLogs(cola).handle(registro)
+
+    texto = logging.Formatter('%(levelname)s - %(message)s').format(cola.get_nowait())
+    assert texto.startswith('ERROR - falló Cali\nTraceback')
+    assert texto.endswith('ValueError: sin datos')
@@ -0,0 +1,70 @@
+"""
+Pruebas del emparejamiento de respuestas bulk con las ciudades pedidas
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractor import WeatherstackExtractor  # noqa: E402
+
+emparejar = WeatherstackExtractor._emparejar_lote
+
+
+def elemento(query, nombre):
+    return {'request': {'query': query}, 'location': {'name': nombre}}
+
+
+def test_empareja_por_nombre_y_no_por_posicion():
+    ciudades = ['Bogota', 'Cali', 'Medellin']
+    data = [elemento('Medellin, Colombia', 'Medellin'), elemento('Bogota, Colombia', 'Bogota')]
+
+    parejas = emparejar(ciudades, [0, 1, 2], data)
+
+    assert [(i, item['location']['name']) for i, item in parejas] == [(2, 'Medellin'), (0, 'Bogota')]
+
+
+def test_compara_sin_pais_ni_mayusculas():
+    ciudades = ['bogota,  colombia', 'Lima']
+    # La API puede devolver solo location.name y con otras mayúsculas
+    data = [{'location': {'name': 'BOGOTA'}}, elemento('Lima, Peru', 'Lima')]
+
+    assert [i for i, _ in emparejar(ciudades, [0, 1], data)] == [0, 1]
+
+
+def test_solo_ciudades_pendientes_y_cada_una_una_vez():
+    ciudades = ['Bogota', 'Cali']
+    data = [elemento('Bogota, Colombia', 'Bogota'), elemento('Bogota, Colombia', 'Bogota'),
+            elemento('Cali, Colombia', 'Cali'), None, 'error']
+
+    # Bogota ya venía de la caché: solo Cali estaba pendiente
+    assert [i for i, _ in emparejar(ciudades, [1], data)] == [1]
+    assert [i for i, _ in emparejar(ciudades, [0, 1], data)] == [0, 1]
+
+
+def test_elemento_desconocido_no_se_asigna():
+    assert emparejar(['Bogota'], [0], [elemento('Quito, Ecuador', 'Quito')]) == []
+
+
+def test_si_falla_la_transformacion_vectorizada_procesa_por_ciudad(monkeypatch):
+    monkeypatch.setenv('API_KEY', 'prueba')
+    monkeypatch.setenv('CACHE_BACKEND', 'ninguna')
+    etl = WeatherstackExtractor()
+    respuestas = [{'location': {'name': c, 'country': 'Colombia'},
+                   'current': {'temperature': 0, 'humidity': 50}} for c in ('Bogota', 'Cali')]
+    consultas = []
+    monkeypatch.setattr(etl, 'extraer_clima_lote', lambda ciudades: list(respuestas))
+    monkeypatch.setattr(etl, 'extraer_clima', lambda ciudad: consultas.append(ciudad))
+
+    def falla(respuestas):
+        raise ValueError('esquema inesperado')
+    monkeypatch.setattr(etl, 'procesar_respuestas_df', falla)
+
+    resultados = etl.extraer_lote(['Bogota', 'Cali'])
+    assert [(r['ciudad'], r['temperatura_c']) for r in resultados] == [('Bogota', 0.0), ('Cali', 0.0)]
+    # Las respuestas ya obtenidas no se vuelven a pedir
+    assert consultas == []
+    etl.cerrar()
@@ -0,0 +1,99 @@
+"""
+Pruebas de la transformación vectorizada (procesar_respuestas_df)
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extractor  # noqa: E402
+from extractor import WeatherstackExtractor  # noqa: E402
+
+
+def respuesta(nombre, **current):
+    datos = {'temperature': 20, 'feelslike': 19, 'humidity': 60, 'wind_speed': 7,
+             'pressure': 1012, 'weather_code': 113, 'weather_descriptions': ['Sunny'],
+             'observation_time': '03:00 PM'}
+    datos.update(current)
+    return {
+        'location': {'name': nombre, 'country': 'Colombia', 'lat': '4.61', 'lon': '-74.08',
+                     'timezone_id': 'America/Bogota', 'localtime_epoch': 1790000000,
+                     'localtime': '2026-09-21 10:13'},
+        'current': {k: v for k, v in datos.items() if v is not None},
+    }
+
+
+RESPUESTAS = [
+    respuesta('Bogota'),
+    # Lecturas en cero: deben quedar como 0, no como faltantes
+    respuesta('Nevado', temperature=0, feelslike=0, humidity=0, wind_speed=0, weather_code=0),
+    # Valores como texto y decimales que int() trunca
+    respuesta('Cali', temperature='24.5', humidity='55.7', pressure=1009.9),
+    # Campos ausentes
+    respuesta('Lima', temperature=None, humidity=None, weather_descriptions=[],
+              observation_time=None),
+    {'location': {}, 'current': {}},
+]
+
+
+@pytest.fixture
+def etl():
+    etl = WeatherstackExtractor.__new__(WeatherstackExtractor)
+    etl.metricas = extractor.MetricasETL()
+    return etl
+
+
+def sin_fecha_extraccion(registro):
+    return {k: v for k, v in registro.items() if k != 'fecha_extraccion'}
+
+
+def test_coincide_con_procesar_respuesta(etl):
+    df = etl.procesar_respuestas_df(RESPUESTAS)
+
+    assert list(df.columns) == list(extractor.ESQUEMA_CLIMA)
+    vectorizados = [sin_fecha_extraccion(r) for r in etl.a_registros(df)]
+    uno_a_uno = [sin_fecha_extraccion(etl.procesar_respuesta(r)) for r in RESPUESTAS]
+    assert vectorizados == uno_a_uno
+
+
+def test_conserva_lecturas_en_cero(etl):
+    nevado = etl.a_registros(etl.procesar_respuestas_df(RESPUESTAS))[1]
+
+    assert nevado['temperatura_c'] == 0
+    assert nevado['temperatura_f'] == 32
+    assert nevado['humedad'] == 0
+    assert nevado['velocidad_viento_kmh'] == 0
+    assert nevado['codigo_clima'] == 0
+
+
+def test_lote_vacio_devuelve_el_esquema(etl):
+    df = etl.procesar_respuestas_df([])
+
+    assert df.empty
+    assert {c: str(t) for c, t in df.dtypes.items()} == extractor.ESQUEMA_CLIMA
+
+
+def test_extraccion_una_por_ciudad_transforma_por_rondas(monkeypatch):
+    monkeypatch.setenv('API_KEY', 'prueba')
+    monkeypatch.setenv('CACHE_BACKEND', 'ninguna')
+    monkeypatch.setenv('CIUDADES', 'Bogota,Nevado,Cali,Lima,Quito')
+    etl = WeatherstackExtractor(max_workers=2)
+    por_ciudad = {r['location'].get('name'): r for r in RESPUESTAS}
+    monkeypatch.setattr(etl, 'extraer_clima', lambda ciudad: por_ciudad.get(ciudad))
+    bloques = []
+    original = etl.procesar_respuestas_df
+    monkeypatch.setattr(etl, 'procesar_respuestas_df',
+                        lambda respuestas: bloques.append(len(respuestas)) or original(respuestas))
+
+    datos = etl.ejecutar_extraccion(tamano_lote=1)
+
+    # Lima no pasa la validación (sin temperatura) y Quito no tiene respuesta
+    assert [d['ciudad'] for d in datos] == ['Bogota', 'Nevado', 'Cali']
+    # Rondas de 2 ciudades; la ronda de Quito no tiene respuestas que transformar
+    assert bloques == [2, 2]
+    etl.cerrar()
@@ -0,0 +1,76 @@
+"""
+Pruebas del reporte de validar_datos_df
+
+Ejecutar desde 02-week/01-session con:  python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extractor  # noqa: E402
+from extractor import WeatherstackExtractor  # noqa: E402
+
+
+def registro(ciudad, temperatura=20.0, humedad=60):
+    datos = dict.fromkeys(extractor.ESQUEMA_CLIMA)
+    datos.update(ciudad=ciudad, temperatura_c=temperatura, humedad=humedad,
+                 fecha_extraccion='2026-10-01T15:00:00')
+    return datos
+
+
+REGISTROS = [
+    registro('Bogota'),
+    registro('Nevado', temperatura=0.0, humedad=0),
+    registro('Horno', temperatura=99.0),
+    registro('Sin temperatura', temperatura=None),
+    registro('Saturada', temperatura=80.0, humedad=120),
+]
+
+
+@pytest.fixture
+def etl():
+    etl = WeatherstackExtractor.__new__(WeatherstackExtractor)
+    etl.metricas = extractor.MetricasETL()
+    return etl
+
+
+def test_reporta_cada_regla_con_sus_indices(etl):
+    df = WeatherstackExtractor.a_dataframe(REGISTROS)
+
+    validas, reporte = etl.validar_datos_df(df)
+
+    assert list(validas['ciudad']) == ['Bogota', 'Nevado']
+    assert reporte['temperatura_c_faltante'] == {'cantidad': 1, 'indices': [3]}
+    # Una fila que incumple dos reglas figura en ambas
+    assert reporte['temperatura_fuera_de_rango'] == {'cantidad': 2, 'indices': [2, 4]}
+    assert reporte['humedad_fuera_de_rango'] == {'cantidad': 1, 'indices': [4]}
+    assert reporte['ciudad_faltante']['cantidad'] == 0
+
+
+def test_coincide_con_validar_datos(etl):
+    df = WeatherstackExtractor.a_dataframe(REGISTROS)
+
+    validas, _ = etl.validar_datos_df(df)
+
+    assert list(validas['ciudad']) == [r['ciudad'] for r in REGISTROS if etl.validar_datos(r)]
+
+
+def test_columna_obligatoria_ausente_rechaza_todo(etl):
+    df = WeatherstackExtractor.a_dataframe(REGISTROS).drop(columns=['fecha_extraccion'])
+
+    validas, reporte = etl.validar_datos_df(df)
+
+    assert validas.empty
+    assert reporte['fecha_extraccion_faltante']['cantidad'] == len(REGISTROS)
+
+
+def test_rechazos_suman_a_las_metricas(etl):
+    etl._validar_df(WeatherstackExtractor.a_dataframe(REGISTROS))
+
+    contadores = etl.metricas.resumen()['contadores']
+    assert contadores['filas_rechazadas'] == 3
+    assert contadores['rechazo_temperatura_fuera_de_rango'] == 2